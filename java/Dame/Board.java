@@ -17,46 +17,159 @@ import java.util.*;
 public class Board {
     /** Taille du plateau (10x10) */
     private static final int SIZE = 10;
-    /** Grille du plateau contenant les pièces */
-    private Piece[][] grid;
+    /** Grille du plateau à plat (case (r, c) à l'indice r * SIZE + c), un code de pièce par case */
+    private byte[] cells;
     /** Joueur actuel ('w' pour blancs, 'b' pour noirs) */
     private char currentPlayer;
     
-    /** Historique des hash de positions pour détecter les répétitions */
-    private List<Integer> positionHistory;
+    /** Clés de Zobrist des positions de la partie, dans l'ordre (pour revenir en arrière) */
+    private List<Long> positionHistory;
+    /** Nombre d'occurrences de chaque position de la partie (règle des 3 répétitions) */
+    private Map<Long, Integer> repetitionCounts;
     /** Nombre de coups consécutifs de dames sans capture ni mouvement de pion */
     private int movesWithoutCaptureOrPawn;
     
+    /** Les 4 directions diagonales (dr, dc) : 0 et 1 vers les noirs (lignes décroissantes), 2 et 3 vers les blancs */
+    private static final int[][] DIRECTIONS = {{-1, -1}, {-1, 1}, {1, -1}, {1, 1}};
+    
+    /** Case voisine de chaque case dans chaque direction de DIRECTIONS (-1 si hors du plateau) */
+    private static final int[][] ADJ = new int[SIZE * SIZE][DIRECTIONS.length];
+    /** Cases successives de la demi-diagonale partant de chaque case dans chaque direction (bord exclu) */
+    private static final int[][][] RAYS = new int[SIZE * SIZE][DIRECTIONS.length][];
+    static {
+        // Les bornes du plateau sont intégrées aux tables : la génération des coups ne teste plus isValidPos
+        for (int r = 0; r < SIZE; r++) {
+            for (int c = 0; c < SIZE; c++) {
+                int sq = r * SIZE + c;
+                for (int d = 0; d < DIRECTIONS.length; d++) {
+                    int dr = DIRECTIONS[d][0], dc = DIRECTIONS[d][1];
+                    int len = 0;
+                    while (r + dr * (len + 1) >= 0 && r + dr * (len + 1) < SIZE
+                           && c + dc * (len + 1) >= 0 && c + dc * (len + 1) < SIZE) {
+                        len++;
+                    }
+                    RAYS[sq][d] = new int[len];
+                    for (int i = 0; i < len; i++) {
+                        RAYS[sq][d][i] = (r + dr * (i + 1)) * SIZE + (c + dc * (i + 1));
+                    }
+                    ADJ[sq][d] = len > 0 ? RAYS[sq][d][0] : -1;
+                }
+            }
+        }
+    }
+    
+    /** Tampon de la recherche de rafles, réutilisé d'un appel à l'autre : cases des pièces prises, dans l'ordre de la rafle */
+    private final int[] captureStack = new int[SIZE * SIZE / 2];
+    
+    /*
+     * Bitboards : les 50 cases jouables sont numérotées sur un long, 11 bits par paire de rangées.
+     * Rangée paire 2p : bits 11p..11p+4 ; rangée impaire 2p+1 : bits 11p+5..11p+9 ; le bit 11p+10
+     * est une case fantôme qui absorbe les débordements de colonne. Avec cette numérotation,
+     * (r+1, c-1) = bit + 5, (r+1, c+1) = bit + 6, (r-1, c-1) = bit - 6 et (r-1, c+1) = bit - 5.
+     */
+    /** Bit de chaque case de la grille (-1 pour une case claire) */
+    private static final int[] SQ_TO_BIT = new int[SIZE * SIZE];
+    /** Case de la grille de chaque bit (-1 pour un bit fantôme ou hors plateau) */
+    private static final int[] BIT_TO_SQ = new int[64];
+    /** Masque du bit de chaque case de la grille (0 pour une case claire) */
+    private static final long[] SQ_MASK = new long[SIZE * SIZE];
+    /** Masque des 50 bits correspondant à de vraies cases */
+    private static final long VALID;
+    static {
+        Arrays.fill(SQ_TO_BIT, -1);
+        Arrays.fill(BIT_TO_SQ, -1);
+        long valid = 0L;
+        for (int r = 0; r < SIZE; r++) {
+            for (int c = 0; c < SIZE; c++) {
+                if ((r + c) % 2 == 0) continue;
+                int bit = 11 * (r / 2) + (r % 2 == 0 ? 0 : 5) + c / 2;
+                SQ_TO_BIT[r * SIZE + c] = bit;
+                BIT_TO_SQ[bit] = r * SIZE + c;
+                SQ_MASK[r * SIZE + c] = 1L << bit;
+                valid |= 1L << bit;
+            }
+        }
+        VALID = valid;
+    }
+    
+    /** Pions blancs, pions noirs, dames blanches et dames noires (un bit par case occupée) */
+    private long whiteMen, blackMen, whiteQueens, blackQueens;
+    
+    /** Clés de Zobrist : une clé aléatoire par (code de pièce, case), nulle pour une case vide */
+    private static final long[][] ZOBRIST = new long[5][SIZE * SIZE];
+    /** Clé de Zobrist ajoutée quand les noirs ont le trait */
+    public static final long ZOBRIST_BLACK_TO_MOVE;
+    static {
+        // Graine fixe : les clés sont identiques d'une exécution à l'autre
+        Random rnd = new Random(0);
+        for (int code = 1; code < ZOBRIST.length; code++) {
+            for (int sq = 0; sq < SIZE * SIZE; sq++) {
+                ZOBRIST[code][sq] = rnd.nextLong();
+            }
+        }
+        ZOBRIST_BLACK_TO_MOVE = rnd.nextLong();
+    }
+    
+    /** Grille de la position initiale, copiée par chaque nouveau plateau */
+    private static final byte[] START_CELLS = buildStartCells();
+    
+    /** Clé de Zobrist de la position (pièces + trait), mise à jour à chaque modification */
+    private long zobristKey;
+    
     /**
      * Constructeur du plateau de jeu.
-     * Initialise une grille vide, positionne les piéces, et prépare les structures pour les règles de nullité.
+     * Copie la grille de départ précalculée, et prépare les structures pour les règles de nullité.
      */
     public Board() {
-        // Créer une grille 10x10 (initialement vide)
-        grid = new Piece[SIZE][SIZE];
+        // Grille 10x10 à plat, copiée depuis le modèle précalculé de la position initiale
+        cells = START_CELLS.clone();
         // Le joueur blanc commence toujours
         currentPlayer = 'w';
         // Historique des positions pour détecter les répétitions
         positionHistory = new ArrayList<>();
+        repetitionCounts = new HashMap<>();
         // Compteur de coups sans capture ni mouvement de pion (règle des 25 coups)
         movesWithoutCaptureOrPawn = 0;
-        // Placer les piéces dans leur position initiale
-        initBoard();
+        // Calculer la clé de Zobrist et les bitboards de la position initiale
+        zobristKey = computeZobristKey();
+        computeBitboards();
+        // La position initiale compte comme première occurrence
+        recordPosition(zobristKey);
+    }
+    
+    /**
+     * Remet le plateau dans la position initiale sans réallouer ses structures
+     * (grille, historique et compteur de répétitions sont vidés et réutilisés).
+     * Permet de jouer plusieurs parties à la suite sur le même plateau.
+     */
+    public void reset() {
+        System.arraycopy(START_CELLS, 0, cells, 0, cells.length);
+        currentPlayer = 'w';
+        positionHistory.clear();
+        repetitionCounts.clear();
+        movesWithoutCaptureOrPawn = 0;
+        zobristKey = computeZobristKey();
+        computeBitboards();
+        recordPosition(zobristKey);
     }
     
     /**
-     * Initialise le plateau avec les piéces dans leur configuration de début de partie.
+     * Construit la grille de début de partie, calculée une seule fois au chargement de la classe.
      * - Blancs : 20 pions dans les 4 premières rangées (cases noires seulement)
      * - Noirs : 20 pions dans les 4 dernières rangées (cases noires seulement)
      * - Centre vide : 4 rangées centrales sans piéces
+     * 
+     * @return La grille à plat de la position initiale
      */
-    private void initBoard() {
+    private static byte[] buildStartCells() {
+        byte[] cells = new byte[SIZE * SIZE];
+        
         // Initialiser les piéces blanches en bas (rangées 0-3)
         for (int r = 0; r < 4; r++) {
             for (int c = 0; c < SIZE; c++) {
                 // Placer les piéces uniquement sur les cases noires (r + c impair)
                 if ((r + c) % 2 == 1) {
-                    grid[r][c] = new Piece('w');
+                    cells[r * SIZE + c] = Piece.W_PAWN;
                 }
             }
         }
@@ -66,20 +179,22 @@ public class Board {
             for (int c = 0; c < SIZE; c++) {
                 // Placer les piéces uniquement sur les cases noires
                 if ((r + c) % 2 == 1) {
-                    grid[r][c] = new Piece('b');
+                    cells[r * SIZE + c] = Piece.B_PAWN;
                 }
             }
         }
         // Les rangées 4-5 restent vides (centre du plateau)
+        return cells;
     }
     
     /**
-     * Retourne la grille du plateau.
+     * Retourne la grille du plateau à plat.
+     * La case (r, c) se trouve à l'indice r * 10 + c et contient un code de {@link Piece}.
      * 
-     * @return La matrice 10x10 contenant les piéces
+     * @return Le tableau de 100 codes de pièces (à ne pas modifier)
      */
-    public Piece[][] getGrid() {
-        return grid;
+    public byte[] getCells() {
+        return cells;
     }
     
     /**
@@ -97,22 +212,96 @@ public class Board {
      * @param player La couleur du joueur ('w' ou 'b')
      */
     public void setCurrentPlayer(char player) {
+        // Le trait fait partie de la clé de Zobrist
+        if (player != currentPlayer) {
+            zobristKey ^= ZOBRIST_BLACK_TO_MOVE;
+        }
         this.currentPlayer = player;
     }
     
+    /**
+     * Retourne la clé de Zobrist de la position (pièces et trait).
+     * Maintenue de façon incrémentale : aucun parcours du plateau n'est nécessaire.
+     * 
+     * @return La clé 64 bits de la position
+     */
+    public long getZobristKey() {
+        return zobristKey;
+    }
+    
+    /**
+     * Calcule la clé de Zobrist complète en parcourant le plateau.
+     * Utilisé uniquement à l'initialisation et à la remise à zéro, les coups mettent la clé à jour par XOR.
+     * 
+     * @return La clé 64 bits de la position
+     */
+    private long computeZobristKey() {
+        long key = currentPlayer == 'b' ? ZOBRIST_BLACK_TO_MOVE : 0L;
+        for (int sq = 0; sq < cells.length; sq++) {
+            key ^= ZOBRIST[cells[sq]][sq];
+        }
+        return key;
+    }
+    
+    /**
+     * Recalcule les bitboards à partir de la grille.
+     * Utilisé à l'initialisation, à la remise à zéro et à la restauration, les coups mettent les bitboards à jour par XOR.
+     */
+    private void computeBitboards() {
+        whiteMen = blackMen = whiteQueens = blackQueens = 0L;
+        for (int sq = 0; sq < cells.length; sq++) {
+            if (cells[sq] != Piece.EMPTY && SQ_TO_BIT[sq] >= 0) {
+                toggleBit(cells[sq], 1L << SQ_TO_BIT[sq]);
+            }
+        }
+    }
+    
+    /**
+     * Inverse un bit dans le bitboard correspondant à un code de pièce.
+     * 
+     * @param code Code de la pièce (sans effet pour une case vide)
+     * @param mask Masque du bit de la case
+     */
+    private void toggleBit(byte code, long mask) {
+        switch (code) {
+            case Piece.W_PAWN: whiteMen ^= mask; break;
+            case Piece.B_PAWN: blackMen ^= mask; break;
+            case Piece.W_QUEEN: whiteQueens ^= mask; break;
+            case Piece.B_QUEEN: blackQueens ^= mask; break;
+            default: break;
+        }
+    }
+    
+    /**
+     * Modifie le contenu d'une case en mettant à jour la clé de Zobrist et les bitboards.
+     * 
+     * @param sq Indice à plat de la case
+     * @param code Nouveau code de pièce
+     */
+    private void setCell(int sq, byte code) {
+        zobristKey ^= ZOBRIST[cells[sq]][sq] ^ ZOBRIST[code][sq];
+        int bit = SQ_TO_BIT[sq];
+        if (bit >= 0) {
+            long mask = 1L << bit;
+            toggleBit(cells[sq], mask);
+            toggleBit(code, mask);
+        }
+        cells[sq] = code;
+    }
+    
     /**
      * Récupére une pièce à une position donnée.
      * 
      * @param row Ligne (0-9)
      * @param col Colonne (0-9)
-     * @return La pièce à cette position, ou null si la position est invalide ou vide
+     * @return Le code de la pièce à cette position, ou Piece.EMPTY si la position est invalide ou vide
      */
-    public Piece getPiece(int row, int col) {
+    public byte getPiece(int row, int col) {
         // Vérifier que les coordonnées sont valides
         if (row < 0 || row >= SIZE || col < 0 || col >= SIZE) {
-            return null;
+            return Piece.EMPTY;
         }
-        return grid[row][col];
+        return cells[row * SIZE + col];
     }
     
     /**
@@ -120,12 +309,12 @@ public class Board {
      * 
      * @param row Ligne (0-9)
      * @param col Colonne (0-9)
-     * @param piece La pièce à placer (peut être null pour vider une case)
+     * @param piece Le code de la pièce à placer (Piece.EMPTY pour vider une case)
      */
-    public void setPiece(int row, int col, Piece piece) {
+    public void setPiece(int row, int col, byte piece) {
         // Vérifier que les coordonnées sont valides avant de placer la pièce
         if (row >= 0 && row < SIZE && col >= 0 && col < SIZE) {
-            grid[row][col] = piece;
+            setCell(row * SIZE + col, piece);
         }
     }
     
@@ -152,24 +341,14 @@ public class Board {
         List<Move> captureMoves = new ArrayList<>();
         List<Move> normalMoves = new ArrayList<>();
         
-        // Parcourir tout le plateau pour trouver les piéces du joueur
-        for (int r = 0; r < SIZE; r++) {
-            for (int c = 0; c < SIZE; c++) {
-                Piece p = grid[r][c];
-                // Vérifier que c'est une piéce du joueur actuel
-                if (p != null && Character.toLowerCase(p.getCode()) == player) {
-                    // Trouver les captures possibles pour cette piéce
-                    List<Move> caps = findCaptures(r, c, p);
-                    captureMoves.addAll(caps);
-                    
-                    // Ajouter les mouvements normaux uniquement s'il n'y a pas de captures
-                    // (car les captures sont obligatoires)
-                    if (captureMoves.isEmpty()) {
-                        List<Move> norms = findNormalMoves(r, c, p);
-                        normalMoves.addAll(norms);
-                    }
-                }
-            }
+        // Parcourir les piéces du joueur directement depuis ses bitboards
+        // (seuls les pions ayant une prise immédiate sont explorés, les dames le sont toutes)
+        long own = manCaptureStarters(player) | (player == 'w' ? whiteQueens : blackQueens);
+        while (own != 0) {
+            int sq = BIT_TO_SQ[Long.numberOfTrailingZeros(own)];
+            own &= own - 1;
+            // Trouver les captures possibles pour cette piéce
+            captureMoves.addAll(findCaptures(sq / SIZE, sq % SIZE, cells[sq]));
         }
         
         // Appliquer la règle de capture obligatoire
@@ -189,178 +368,251 @@ public class Board {
                     result.add(m);
                 }
             }
+            // Classer les rafles les plus rentables en premier (tri stable)
+            result.sort((a, b) -> Integer.compare(captureOrderScore(b), captureOrderScore(a)));
             return result;
         }
         
-        // Pas de capture disponible : retourner les mouvements normaux
+        // Pas de capture disponible (les captures sont obligatoires) : mouvements normaux
+        // Pions : décalages des bitboards vers les cases vides
+        addManMoves(player, normalMoves);
+        // Dames : parcours des diagonales
+        long queens = player == 'w' ? whiteQueens : blackQueens;
+        while (queens != 0) {
+            int sq = BIT_TO_SQ[Long.numberOfTrailingZeros(queens)];
+            queens &= queens - 1;
+            normalMoves.addAll(findQueenMoves(sq / SIZE, sq % SIZE));
+        }
         return normalMoves;
     }
     
-    private List<Move> findNormalMoves(int r, int c, Piece piece) {
-        List<Move> moves = new ArrayList<>();
-        int[][] directions;
-        
-        if (piece.isDame()) {
-            directions = new int[][]{{-1, -1}, {-1, 1}, {1, -1}, {1, 1}};
-        } else if (piece.isWhite()) {
-            directions = new int[][]{{1, -1}, {1, 1}};
+    /**
+     * Score d'ordre d'une rafle, pour essayer d'abord les plus rentables :
+     * 100 par pièce prise, +10 par dame prise, +1 par pion pris, +5 si le pion est promu.
+     * 
+     * @param move La rafle à classer (pièces encore sur le plateau)
+     * @return Le score d'ordre (plus élevé = plus intéressant)
+     */
+    private int captureOrderScore(Move move) {
+        int score = 100 * move.capturedPositions.length;
+        for (int[] pos : move.capturedPositions) {
+            score += Piece.isDame(cells[pos[0] * SIZE + pos[1]]) ? 10 : 1;
+        }
+        byte piece = cells[move.startRow * SIZE + move.startCol];
+        if (!Piece.isDame(piece) && move.endRow == (Piece.isWhite(piece) ? SIZE - 1 : 0)) {
+            score += 5;
+        }
+        return score;
+    }
+    
+    /**
+     * Calcule en quelques décalages de bitboards les pions d'un joueur qui ont une prise immédiate :
+     * pièce adverse sur une case voisine (dans les 4 directions, les pions prenant aussi en arrière)
+     * et case vide juste derrière. Les autres pions n'ont pas besoin d'être explorés pour les prises.
+     * 
+     * @param player La couleur du joueur ('w' ou 'b')
+     * @return Le bitboard des pions pouvant commencer une prise
+     */
+    private long manCaptureStarters(char player) {
+        long men = player == 'w' ? whiteMen : blackMen;
+        long opponents = player == 'w' ? (blackMen | blackQueens) : (whiteMen | whiteQueens);
+        long empty = ~(whiteMen | blackMen | whiteQueens | blackQueens) & VALID;
+        // Pour chaque direction : case d'arrivée vide derrière une pièce adverse voisine, ramenée à la case de départ
+        return (((((men << 5) & opponents) << 5) & empty) >>> 10)
+             | (((((men << 6) & opponents) << 6) & empty) >>> 12)
+             | (((((men >>> 5) & opponents) >>> 5) & empty) << 10)
+             | (((((men >>> 6) & opponents) >>> 6) & empty) << 12);
+    }
+    
+    /**
+     * Ajoute les déplacements simples de tous les pions d'un joueur.
+     * Les cases d'arrivée sont obtenues en une fois par décalage du bitboard des pions
+     * (les bits fantômes et le masque VALID éliminent les débordements de bord).
+     * 
+     * @param player La couleur du joueur ('w' ou 'b')
+     * @param moves Liste recevant les déplacements
+     */
+    private void addManMoves(char player, List<Move> moves) {
+        long empty = ~(whiteMen | blackMen | whiteQueens | blackQueens) & VALID;
+        if (player == 'w') {
+            // Les blancs avancent vers les rangées croissantes
+            addShiftedMoves((whiteMen << 5) & empty, -5, moves);
+            addShiftedMoves((whiteMen << 6) & empty, -6, moves);
         } else {
-            directions = new int[][]{{-1, -1}, {-1, 1}};
+            // Les noirs avancent vers les rangées décroissantes
+            addShiftedMoves((blackMen >>> 6) & empty, 6, moves);
+            addShiftedMoves((blackMen >>> 5) & empty, 5, moves);
+        }
+    }
+    
+    /**
+     * Crée un déplacement pour chaque bit d'arrivée d'un masque.
+     * 
+     * @param targets Bits des cases d'arrivée
+     * @param fromOffset Décalage à ajouter au bit d'arrivée pour retrouver le bit de départ
+     * @param moves Liste recevant les déplacements
+     */
+    private void addShiftedMoves(long targets, int fromOffset, List<Move> moves) {
+        while (targets != 0) {
+            int bit = Long.numberOfTrailingZeros(targets);
+            targets &= targets - 1;
+            int to = BIT_TO_SQ[bit];
+            int from = BIT_TO_SQ[bit + fromOffset];
+            moves.add(new Move(from / SIZE, from % SIZE, to / SIZE, to % SIZE, new int[0][0]));
         }
+    }
+    
+    private List<Move> findQueenMoves(int r, int c) {
+        List<Move> moves = new ArrayList<>();
+        int sq = r * SIZE + c;
         
-        for (int[] dir : directions) {
-            int dr = dir[0], dc = dir[1];
-            
-            if (piece.isDame()) {
-                // Une dame peut se déplacer de plusieurs cases
-                for (int dist = 1; dist < SIZE; dist++) {
-                    int nr = r + dr * dist;
-                    int nc = c + dc * dist;
-                    
-                    if (!isValidPos(nr, nc)) break;
-                    if (grid[nr][nc] != null) break;
-                    
-                    moves.add(new Move(r, c, nr, nc, new int[0][0]));
-                }
-            } else {
-                // Un pion se déplace d'une case
-                int nr = r + dr;
-                int nc = c + dc;
-                
-                if (isValidPos(nr, nc) && grid[nr][nc] == null) {
-                    moves.add(new Move(r, c, nr, nc, new int[0][0]));
-                }
+        // Une dame peut se déplacer de plusieurs cases
+        for (int d = 0; d < DIRECTIONS.length; d++) {
+            for (int next : RAYS[sq][d]) {
+                if (cells[next] != Piece.EMPTY) break;
+                moves.add(new Move(r, c, next / SIZE, next % SIZE, new int[0][0]));
             }
         }
         
         return moves;
     }
     
-    private List<Move> findCaptures(int r, int c, Piece piece) {
+    private List<Move> findCaptures(int r, int c, byte piece) {
         List<Move> allCaptures = new ArrayList<>();
-        boolean[][] visited = new boolean[SIZE][SIZE];
-        visited[r][c] = true;
+        int start = r * SIZE + c;
         
-        dfsCapture(r, c, r, c, piece, visited, new ArrayList<>(), allCaptures);
+        dfsCapture(start, start, piece, 0, -1, SQ_MASK[start], 0L, allCaptures);
         
         return allCaptures;
     }
     
-    private void dfsCapture(int startR, int startC, int r, int c, Piece piece, boolean[][] visited, 
-                           List<int[]> capturedSoFar, List<Move> allCaptures) {
-        int[][] directions = {{-1, -1}, {-1, 1}, {1, -1}, {1, 1}};
+    /**
+     * Parcours en profondeur des rafles depuis une case.
+     * Travaille directement sur la grille à plat : les cases visitées et les pièces déjà prises
+     * sont des masques de bits passés par valeur (rien à démarquer au retour), et la séquence
+     * des prises est empilée dans captureStack (profondeur = nombre de prises).
+     * Aucune allocation n'est faite pendant la recherche, sauf pour les coups produits.
+     * 
+     * @param start Case de départ de la pièce (indice à plat)
+     * @param sq Case actuelle de la pièce (indice à plat)
+     * @param piece Code de la pièce qui capture
+     * @param depth Nombre de pièces déjà prises dans la séquence
+     * @param arrivalDir Direction de la dernière prise (-1 au départ) : la direction inverse,
+     *                   qui repasserait sur la pièce tout juste prise, n'est pas explorée
+     * @param visited Bits des cases déjà atteintes pendant la rafle (départ compris)
+     * @param captured Bits des pièces déjà prises (elles restent sur le plateau jusqu'à la fin)
+     * @param allCaptures Liste recevant les rafles complètes
+     */
+    private void dfsCapture(int start, int sq, byte piece, int depth, int arrivalDir, long visited, long captured,
+                            List<Move> allCaptures) {
         boolean foundCapture = false;
+        boolean isDame = Piece.isDame(piece);
+        // Inverse d'une direction : 0 <-> 3 et 1 <-> 2 (voir DIRECTIONS)
+        int backDir = arrivalDir < 0 ? -1 : 3 - arrivalDir;
         
-        for (int[] dir : directions) {
-            int dr = dir[0], dc = dir[1];
+        for (int d = 0; d < DIRECTIONS.length; d++) {
+            if (d == backDir) continue;
             
-            if (piece.isDame()) {
+            if (isDame) {
                 // Une dame peut sauter un adversaire à n'importe quelle distance
-                for (int dist = 1; dist < SIZE - 1; dist++) {
-                    int enemyR = r + dr * dist;
-                    int enemyC = c + dc * dist;
-                    
-                    if (!isValidPos(enemyR, enemyC)) break;
-                    Piece enemy = grid[enemyR][enemyC];
-                    
-                    if (enemy == null) continue;
-                    if (!piece.areOpponents(enemy)) break;
-                    
-                    boolean alreadyCaptured = false;
-                    for (int[] cap : capturedSoFar) {
-                        if (cap[0] == enemyR && cap[1] == enemyC) {
-                            alreadyCaptured = true;
-                            break;
-                        }
-                    }
-                    if (alreadyCaptured) break;
+                // Un seul passage sur la diagonale : première pièce rencontrée, puis cases d'atterrissage derrière elle
+                int[] ray = RAYS[sq][d];
+                int k = 0;
+                while (k < ray.length && cells[ray[k]] == Piece.EMPTY) k++;
+                if (k >= ray.length - 1) continue;
+                
+                int enemy = ray[k];
+                if (!Piece.areOpponents(piece, cells[enemy]) || (captured & SQ_MASK[enemy]) != 0) continue;
+                
+                // Rechercher les cases d'atterrissage après cet adversaire
+                for (int j = k + 1; j < ray.length; j++) {
+                    int land = ray[j];
+                    if (cells[land] != Piece.EMPTY) break;
+                    if ((visited & SQ_MASK[land]) != 0) break;
                     
-                    // Rechercher les cases d'atterrissage après cet adversaire
-                    for (int landDist = dist + 1; landDist < SIZE; landDist++) {
-                        int landR = r + dr * landDist;
-                        int landC = c + dc * landDist;
-                        
-                        if (!isValidPos(landR, landC)) break;
-                        if (grid[landR][landC] != null) break;
-                        if (visited[landR][landC]) break;
-                        
-                        foundCapture = true;
-                        visited[landR][landC] = true;
-                        capturedSoFar.add(new int[]{enemyR, enemyC});
-                        
-                        dfsCapture(startR, startC, landR, landC, piece, visited, capturedSoFar, allCaptures);
-                        
-                        capturedSoFar.remove(capturedSoFar.size() - 1);
-                        visited[landR][landC] = false;
-                    }
-                    break;
+                    foundCapture = true;
+                    captureStack[depth] = enemy;
+                    dfsCapture(start, land, piece, depth + 1, d, visited | SQ_MASK[land],
+                               captured | SQ_MASK[enemy], allCaptures);
                 }
             } else {
                 // Un pion saute exactement une case au-dessus d'un adversaire
-                int enemyR = r + dr;
-                int enemyC = c + dc;
-                int landR = r + 2 * dr;
-                int landC = c + 2 * dc;
-                
-                if (!isValidPos(enemyR, enemyC) || !isValidPos(landR, landC)) continue;
+                int enemy = ADJ[sq][d];
+                if (enemy < 0) continue;
+                int land = ADJ[enemy][d];
+                if (land < 0) continue;
                 
-                Piece enemy = grid[enemyR][enemyC];
-                if (enemy == null || !piece.areOpponents(enemy)) continue;
-                
-                boolean alreadyCaptured = false;
-                for (int[] cap : capturedSoFar) {
-                    if (cap[0] == enemyR && cap[1] == enemyC) {
-                        alreadyCaptured = true;
-                        break;
-                    }
-                }
-                if (alreadyCaptured) continue;
-                
-                if (grid[landR][landC] != null || visited[landR][landC]) continue;
+                if (!Piece.areOpponents(piece, cells[enemy]) || (captured & SQ_MASK[enemy]) != 0) continue;
+                if (cells[land] != Piece.EMPTY || (visited & SQ_MASK[land]) != 0) continue;
                 
                 foundCapture = true;
-                visited[landR][landC] = true;
-                capturedSoFar.add(new int[]{enemyR, enemyC});
-                
-                dfsCapture(startR, startC, landR, landC, piece, visited, capturedSoFar, allCaptures);
-                
-                capturedSoFar.remove(capturedSoFar.size() - 1);
-                visited[landR][landC] = false;
+                captureStack[depth] = enemy;
+                dfsCapture(start, land, piece, depth + 1, d, visited | SQ_MASK[land],
+                           captured | SQ_MASK[enemy], allCaptures);
             }
         }
         
-        if (!foundCapture && !capturedSoFar.isEmpty()) {
-            int[][] captured = new int[capturedSoFar.size()][2];
-            for (int i = 0; i < capturedSoFar.size(); i++) {
-                captured[i] = capturedSoFar.get(i);
+        if (!foundCapture && depth > 0) {
+            int[][] positions = new int[depth][];
+            for (int i = 0; i < depth; i++) {
+                positions[i] = new int[]{captureStack[i] / SIZE, captureStack[i] % SIZE};
             }
-            // startRow et startCol sont corrigés dans findCaptures
-            allCaptures.add(new Move(startR, startC, r, c, captured));
+            allCaptures.add(new Move(start / SIZE, start % SIZE, sq / SIZE, sq % SIZE, positions));
         }
     }
     
+    /**
+     * Joue un coup de la partie et l'ajoute à l'historique des positions (règle des répétitions).
+     * La position est enregistrée avec le trait à l'adversaire du joueur courant : l'appelant doit
+     * donner le trait à cet adversaire (setCurrentPlayer) juste après, sinon les répétitions
+     * ne seront jamais reconnues par isDraw() et winner().
+     * 
+     * @param move Le coup à jouer
+     */
     public void applyMove(Move move) {
-        Piece piece = grid[move.startRow][move.startCol];
-        boolean isPawn = (piece != null && !piece.isDame());
+        playMove(move);
+        
+        // Ajouter la position à l'historique, avec le trait à l'adversaire : chaque appelant
+        // (GameUI, TournoiUI, IA_MC) doit appeler setCurrentPlayer juste après le coup
+        recordPosition(zobristKey ^ ZOBRIST_BLACK_TO_MOVE);
+    }
+    
+    /**
+     * Ajoute une position à l'historique de la partie et incrémente son compteur de répétitions.
+     * 
+     * @param key Clé de Zobrist de la position
+     */
+    private void recordPosition(long key) {
+        positionHistory.add(key);
+        repetitionCounts.merge(key, 1, Integer::sum);
+    }
+    
+    /**
+     * Déplace la pièce, retire les prises, promeut et met à jour le compteur des 25 coups.
+     * L'historique des positions n'est pas modifié.
+     * 
+     * @param move Le coup à jouer
+     */
+    private void playMove(Move move) {
+        int from = move.startRow * SIZE + move.startCol;
+        int to = move.endRow * SIZE + move.endCol;
+        byte piece = cells[from];
+        boolean isPawn = (piece != Piece.EMPTY && !Piece.isDame(piece));
         boolean hasCapture = (move.capturedPositions != null && move.capturedPositions.length > 0);
         
-        grid[move.startRow][move.startCol] = null;
-        grid[move.endRow][move.endCol] = piece;
+        setCell(from, Piece.EMPTY);
+        setCell(to, piece);
         
         // Retirer les pièces capturées
         if (move.capturedPositions != null) {
             for (int[] pos : move.capturedPositions) {
-                grid[pos[0]][pos[1]] = null;
+                setCell(pos[0] * SIZE + pos[1], Piece.EMPTY);
             }
         }
         
         // Promotion en dame
-        if (piece != null) {
-            if (piece.isWhite() && move.endRow == SIZE - 1) {
-                piece.promote();
-            } else if (piece.isBlack() && move.endRow == 0) {
-                piece.promote();
-            }
+        if ((Piece.isWhite(piece) && move.endRow == SIZE - 1) || (Piece.isBlack(piece) && move.endRow == 0)) {
+            setCell(to, Piece.promote(piece));
         }
         
         // Mise à jour du compteur pour règle des 25 coups
@@ -369,64 +621,88 @@ public class Board {
         } else {
             movesWithoutCaptureOrPawn++;
         }
-        
-        // Ajouter la position à l'historique
-        positionHistory.add(hashCode());
     }
     
+    /**
+     * Joue un coup de façon réversible pour la recherche (à annuler avec undoMove).
+     * L'historique officiel des positions n'est pas modifié : la détection des
+     * répétitions pendant la recherche est à la charge de l'IA.
+     * 
+     * @param move Le coup à jouer
+     * @return Les informations nécessaires pour annuler le coup
+     */
     public MoveUndo makeMove(Move move) {
-        Piece piece = grid[move.startRow][move.startCol];
-        boolean wasDame = piece != null && piece.isDame();
+        byte origCode = cells[move.startRow * SIZE + move.startCol];
         int oldMovesWithoutCaptureOrPawn = movesWithoutCaptureOrPawn;
         
-        List<Piece> capturedPieces = new ArrayList<>();
-        if (move.capturedPositions != null) {
-            for (int[] pos : move.capturedPositions) {
-                capturedPieces.add(grid[pos[0]][pos[1]]);
-            }
+        byte[] capturedCodes = new byte[move.capturedPositions != null ? move.capturedPositions.length : 0];
+        for (int i = 0; i < capturedCodes.length; i++) {
+            int[] pos = move.capturedPositions[i];
+            capturedCodes[i] = cells[pos[0] * SIZE + pos[1]];
         }
         
-        applyMove(move);
+        playMove(move);
         
-        return new MoveUndo(move, wasDame, capturedPieces, oldMovesWithoutCaptureOrPawn);
+        return new MoveUndo(move, origCode, capturedCodes, oldMovesWithoutCaptureOrPawn);
     }
     
     public void undoMove(MoveUndo undo) {
         Move move = undo.move;
-        Piece piece = grid[move.endRow][move.endCol];
-        
-        // Restaurer la position de la pièce
-        grid[move.startRow][move.startCol] = piece;
-        grid[move.endRow][move.endCol] = null;
         
-        // Restaurer le statut de dame
-        if (piece != null && !undo.wasDame && piece.isDame()) {
-            if (piece.isWhite()) {
-                piece.setCode('w');
-            } else {
-                piece.setCode('b');
-            }
-        }
+        // Restaurer la position de la pièce (et son statut de pion si elle a été promue)
+        setCell(move.endRow * SIZE + move.endCol, Piece.EMPTY);
+        setCell(move.startRow * SIZE + move.startCol, undo.origCode);
         
         // Restaurer les pièces capturées
-        if (move.capturedPositions != null) {
-            for (int i = 0; i < move.capturedPositions.length; i++) {
-                int[] pos = move.capturedPositions[i];
-                grid[pos[0]][pos[1]] = undo.capturedPieces.get(i);
-            }
-        }
-        
-        // Retirer la dernière position de l'historique
-        if (!positionHistory.isEmpty()) {
-            positionHistory.remove(positionHistory.size() - 1);
+        for (int i = 0; i < undo.capturedCodes.length; i++) {
+            int[] pos = move.capturedPositions[i];
+            setCell(pos[0] * SIZE + pos[1], undo.capturedCodes[i]);
         }
         
         // Restaurer le compteur de coups sans progression
         movesWithoutCaptureOrPawn = undo.movesWithoutCaptureOrPawn;
     }
     
+    /**
+     * Vérifie si le joueur donné a au moins un coup légal, sans construire la liste des coups.
+     * Un déplacement simple suffit (trouvé par décalage des bitboards) : s'il existe, le joueur
+     * a forcément un coup (ce déplacement ou une prise obligatoire). Sinon, seules les prises
+     * peuvent être jouables : celles des pions se lisent sur les bitboards, puis chaque dame
+     * est testée jusqu'à la première trouvée.
+     * 
+     * @param player La couleur du joueur ('w' ou 'b')
+     * @return true si le joueur peut jouer, false sinon
+     */
+    public boolean hasLegalMove(char player) {
+        long empty = ~(whiteMen | blackMen | whiteQueens | blackQueens) & VALID;
+        long men = player == 'w' ? whiteMen : blackMen;
+        long queens = player == 'w' ? whiteQueens : blackQueens;
+        
+        // Pas d'un pion vers l'avant
+        long manSteps = player == 'w' ? (men << 5) | (men << 6) : (men >>> 5) | (men >>> 6);
+        // Pas d'une dame dans une des 4 directions
+        long queenSteps = (queens << 5) | (queens << 6) | (queens >>> 5) | (queens >>> 6);
+        if (((manSteps | queenSteps) & empty) != 0) {
+            return true;
+        }
+        
+        // Aucun déplacement simple : chercher une prise
+        if (manCaptureStarters(player) != 0) {
+            return true;
+        }
+        long own = queens;
+        while (own != 0) {
+            int sq = BIT_TO_SQ[Long.numberOfTrailingZeros(own)];
+            own &= own - 1;
+            if (!findCaptures(sq / SIZE, sq % SIZE, cells[sq]).isEmpty()) {
+                return true;
+            }
+        }
+        return false;
+    }
+    
     public boolean isTerminal() {
-        return legalMoves(currentPlayer).isEmpty();
+        return !hasLegalMove(currentPlayer);
     }
     
     /**
@@ -434,7 +710,7 @@ public class Board {
      * À utiliser uniquement dans le jeu réel, PAS dans minimax.
      */
     public boolean isTerminalWithDraw() {
-        return legalMoves(currentPlayer).isEmpty() || isDraw();
+        return !hasLegalMove(currentPlayer) || isDraw();
     }
     
     /**
@@ -443,18 +719,9 @@ public class Board {
      * 2. 25 coups de dames consécutifs sans prise ni mouvement de pion
      */
     public boolean isDraw() {
-        // Règle 1 : Position répétée 3 fois
-        if (positionHistory.size() >= 3) {
-            int currentHash = hashCode();
-            int repetitions = 0;
-            for (int hash : positionHistory) {
-                if (hash == currentHash) {
-                    repetitions++;
-                    if (repetitions >= 3) {
-                        return true;
-                    }
-                }
-            }
+        // Règle 1 : Position répétée 3 fois (compteur tenu à jour à chaque coup)
+        if (repetitionCounts.getOrDefault(zobristKey, 0) >= 3) {
+            return true;
         }
         
         // Règle 2 : 25 coups de dames sans prise ni mouvement de pion
@@ -465,6 +732,12 @@ public class Board {
         return false;
     }
     
+    /**
+     * Retourne le résultat de la position, ce qui indique aussi en un seul appel si la partie est finie
+     * (équivaut à isTerminalWithDraw() suivi du calcul du gagnant).
+     * 
+     * @return 'w' ou 'b' pour le gagnant, 'd' pour un nul, ' ' si la partie continue
+     */
     public char winner() {
         // Vérifier d'abord les règles d'égalité
         if (isDraw()) {
@@ -479,67 +752,143 @@ public class Board {
     }
     
     public int[] countPieces() {
-        int white = 0;
-        int black = 0;
-        
-        for (int r = 0; r < SIZE; r++) {
-            for (int c = 0; c < SIZE; c++) {
-                Piece p = grid[r][c];
-                if (p != null) {
-                    if (p.isWhite()) {
-                        white++;
-                    } else {
-                        black++;
-                    }
-                }
-            }
-        }
-        
-        return new int[]{white, black};
+        // Un comptage de bits par couleur au lieu d'un parcours de la grille
+        return new int[]{Long.bitCount(whiteMen | whiteQueens), Long.bitCount(blackMen | blackQueens)};
+    }
+    
+    /**
+     * Compte les pions d'une couleur.
+     * 
+     * @param color La couleur ('w' ou 'b')
+     * @return Le nombre de pions de cette couleur
+     */
+    public int countMen(char color) {
+        return Long.bitCount(color == 'w' ? whiteMen : blackMen);
+    }
+    
+    /**
+     * Compte les dames d'une couleur.
+     * 
+     * @param color La couleur ('w' ou 'b')
+     * @return Le nombre de dames de cette couleur
+     */
+    public int countQueens(char color) {
+        return Long.bitCount(color == 'w' ? whiteQueens : blackQueens);
+    }
+    
+    /**
+     * Constructeur de copie : duplique la grille et les compteurs sans repartir de la position initiale.
+     * 
+     * @param other Le plateau à copier
+     */
+    private Board(Board other) {
+        cells = other.cells.clone();
+        currentPlayer = other.currentPlayer;
+        positionHistory = new ArrayList<>(other.positionHistory);
+        repetitionCounts = new HashMap<>(other.repetitionCounts);
+        movesWithoutCaptureOrPawn = other.movesWithoutCaptureOrPawn;
+        zobristKey = other.zobristKey;
+        whiteMen = other.whiteMen;
+        blackMen = other.blackMen;
+        whiteQueens = other.whiteQueens;
+        blackQueens = other.blackQueens;
     }
     
     public Board copy() {
-        Board newBoard = new Board();
-        newBoard.currentPlayer = this.currentPlayer;
-        newBoard.movesWithoutCaptureOrPawn = this.movesWithoutCaptureOrPawn;
-        newBoard.positionHistory = new ArrayList<>(this.positionHistory);
-        
-        for (int r = 0; r < SIZE; r++) {
-            for (int c = 0; c < SIZE; c++) {
-                if (this.grid[r][c] != null) {
-                    newBoard.grid[r][c] = this.grid[r][c].copy();
-                } else {
-                    newBoard.grid[r][c] = null;
-                }
-            }
+        return new Board(this);
+    }
+    
+    /**
+     * Sauvegarde légère de l'état du plateau (grille de 100 octets et quelques entiers).
+     * L'historique des positions n'est pas copié : seule sa longueur est mémorisée,
+     * les positions ajoutées ensuite sont retirées lors de la restauration.
+     * 
+     * @return La sauvegarde de l'état courant
+     */
+    public Snapshot snapshot() {
+        return new Snapshot(cells.clone(), currentPlayer, movesWithoutCaptureOrPawn,
+                            positionHistory.size(), zobristKey);
+    }
+    
+    /**
+     * Restaure un état sauvegardé par snapshot() sur ce même plateau.
+     * 
+     * @param snapshot La sauvegarde à restaurer
+     */
+    public void restore(Snapshot snapshot) {
+        System.arraycopy(snapshot.cells, 0, cells, 0, cells.length);
+        currentPlayer = snapshot.currentPlayer;
+        movesWithoutCaptureOrPawn = snapshot.movesWithoutCaptureOrPawn;
+        // Retirer les positions jouées depuis la sauvegarde et décompter leurs occurrences
+        while (positionHistory.size() > snapshot.historySize) {
+            long key = positionHistory.remove(positionHistory.size() - 1);
+            repetitionCounts.computeIfPresent(key, (k, n) -> n > 1 ? n - 1 : null);
         }
-        
-        return newBoard;
+        zobristKey = snapshot.zobristKey;
+        computeBitboards();
     }
     
+    /**
+     * Code de hachage de la position, replié depuis la clé de Zobrist déjà maintenue :
+     * aucun parcours de la grille.
+     * 
+     * @return Le code de hachage de la position
+     */
     @Override
     public int hashCode() {
-        int hash = currentPlayer;
-        for (int r = 0; r < SIZE; r++) {
-            for (int c = 0; c < SIZE; c++) {
-                if (grid[r][c] != null) {
-                    hash = hash * 31 + grid[r][c].getCode() + r * SIZE + c;
-                }
-            }
+        return Long.hashCode(zobristKey);
+    }
+    
+    /**
+     * Deux plateaux sont égaux s'ils ont les mêmes pièces et le même joueur au trait.
+     * Cohérent avec hashCode(), les compteurs de nullité ne sont pas comparés.
+     * 
+     * @param o L'objet à comparer
+     * @return true si les positions sont identiques, false sinon
+     */
+    @Override
+    public boolean equals(Object o) {
+        if (this == o) return true;
+        if (!(o instanceof Board)) return false;
+        Board other = (Board) o;
+        return zobristKey == other.zobristKey
+            && currentPlayer == other.currentPlayer
+            && Arrays.equals(cells, other.cells);
+    }
+    
+    /**
+     * État sauvegardé d'un plateau, utilisé pour annuler des coups dans l'interface.
+     */
+    public static class Snapshot {
+        private final byte[] cells;
+        private final char currentPlayer;
+        private final int movesWithoutCaptureOrPawn;
+        /** Longueur de l'historique des positions au moment de la sauvegarde */
+        private final int historySize;
+        private final long zobristKey;
+        
+        private Snapshot(byte[] cells, char currentPlayer, int movesWithoutCaptureOrPawn,
+                         int historySize, long zobristKey) {
+            this.cells = cells;
+            this.currentPlayer = currentPlayer;
+            this.movesWithoutCaptureOrPawn = movesWithoutCaptureOrPawn;
+            this.historySize = historySize;
+            this.zobristKey = zobristKey;
         }
-        return hash;
     }
     
     public static class MoveUndo {
         public Move move;
-        public boolean wasDame;
-        public List<Piece> capturedPieces;
+        /** Code de la pièce déplacée avant le coup (pion si elle vient d'être promue) */
+        public byte origCode;
+        /** Codes des pièces capturées, dans l'ordre de move.capturedPositions */
+        public byte[] capturedCodes;
         public int movesWithoutCaptureOrPawn;
         
-        public MoveUndo(Move move, boolean wasDame, List<Piece> capturedPieces, int movesWithoutCaptureOrPawn) {
+        public MoveUndo(Move move, byte origCode, byte[] capturedCodes, int movesWithoutCaptureOrPawn) {
             this.move = move;
-            this.wasDame = wasDame;
-            this.capturedPieces = capturedPieces;
+            this.origCode = origCode;
+            this.capturedCodes = capturedCodes;
             this.movesWithoutCaptureOrPawn = movesWithoutCaptureOrPawn;
         }
     }
@@ -2,6 +2,7 @@ import javax.swing.*;
 import javax.swing.Timer;
 import java.awt.*;
 import java.awt.event.*;
+import java.awt.image.BufferedImage;
 import java.util.*;
 import java.util.List;
 
@@ -29,6 +30,18 @@ public class GameUI extends JFrame {
     /** Taille du plateau (10x10) */
     private static final int BOARD_SIZE = 10;
     
+    // Couleurs, polices et trait du rendu, créés une seule fois
+    private static final Color LIGHT_SQUARE = new Color(240, 217, 181);
+    private static final Color DARK_SQUARE = new Color(181, 136, 99);
+    private static final Color SELECTED_HIGHLIGHT = new Color(255, 255, 0, 100);
+    private static final Color MOVE_HIGHLIGHT = new Color(0, 255, 0, 100);
+    private static final Color PIECE_SHADOW = new Color(0, 0, 0, 50);
+    private static final Color BLACK_PIECE = new Color(50, 50, 50);
+    private static final Color CROWN_COLOR = new Color(255, 215, 0);
+    private static final Font COORD_FONT = new Font("Arial", Font.PLAIN, 10);
+    private static final Font CROWN_FONT = new Font("Arial", Font.BOLD, 24);
+    private static final BasicStroke PIECE_STROKE = new BasicStroke(2);
+    
     private Board board;
     private BoardPanel boardPanel;
     private JLabel statusLabel;
@@ -54,9 +67,13 @@ public class GameUI extends JFrame {
     
     private Timer iaTimer;
     private boolean stopIAGame = false;
+    /** Recherche d'IA en cours hors du thread EDT (null si aucune n'a été lancée) */
+    private SwingWorker<Move, Void> iaSearch;
+    /** Incrémenté à chaque changement de partie ou annulation : un résultat plus ancien est ignoré */
+    private int searchGeneration = 0;
     
     // Annulation de l'historique
-    private Stack<BoardSnapshot> undoHistory;
+    private Stack<Board.Snapshot> undoHistory;
     
     /**
      * Constructeur de l'interface graphique principale du jeu de dames.
@@ -433,6 +450,8 @@ public class GameUI extends JFrame {
      * Arrête un jeu IA en cours (IAvsIA ou IA vs Humain).
      * Arrête le timer qui ordonne les mouvements de l'IA.
      * Permet d'interrompre une partie longue à tout moment.
+     * Une recherche déjà lancée n'est pas abandonnée : son coup est joué à la fin du calcul,
+     * sinon en mode Humain vs IA le trait resterait à l'IA sans que personne ne puisse jouer.
      */
     private void stopIAGame() {
         stopIAGame = true;
@@ -455,14 +474,17 @@ public class GameUI extends JFrame {
      * 
      * Actions :
      * 1. Arrêter tout jeu IA en cours
-     * 2. Créer un nouveau plateau vierge
+     * 2. Remettre le plateau dans la position initiale
      * 3. Réinitialiser les variables (sélection, historique, etc.)
      * 4. Rafraîchir l'affichage
      * 5. Lancer IAvsIA ou programmer le premier coup IA si applicable
      */
     private void newGame() {
         stopIAGame();
-        board = new Board();
+        // Une recherche lancée sur la partie précédente ne doit pas jouer sur la nouvelle
+        searchGeneration++;
+        // Le plateau est réutilisé (les recherches en cours travaillent sur une copie)
+        board.reset();
         selectedRow = -1;
         selectedCol = -1;
         availableMoves = null;
@@ -499,18 +521,19 @@ public class GameUI extends JFrame {
             return;
         }
         
-        BoardSnapshot snapshot = undoHistory.pop();
-        board = snapshot.board.copy();
+        // Une recherche d'IA lancée avant l'annulation ne doit pas jouer sur le plateau restauré
+        searchGeneration++;
+        board.restore(undoHistory.pop());
         updateDisplay();
     }
     
     /**
      * Sauvegarde l'état actuel du plateau dans l'historique.
      * Appelée avant chaque mouvement humain pour permettre l'annulation.
-     * Le plateau est copié (pas de référence) pour éviter les modifications accidentelles.
+     * Seule la grille (100 octets) et les compteurs sont sauvegardés, pas un plateau complet.
      */
     private void saveSnapshot() {
-        undoHistory.push(new BoardSnapshot(board.copy()));
+        undoHistory.push(board.snapshot());
     }
     
     /**
@@ -533,8 +556,9 @@ public class GameUI extends JFrame {
         int[] counts = board.countPieces();
         statsLabel.setText(String.format("Pièces - Blancs: %d | Noirs: %d", counts[0], counts[1]));
         
-        if (board.isTerminalWithDraw()) {
-            char winner = board.winner();
+        // winner() donne en un seul appel la fin de partie et son résultat (' ' = partie en cours)
+        char winner = board.winner();
+        if (winner != ' ') {
             if (winner == 'w') {
                 turnLabel.setText("★ VICTOIRE DES BLANCS! ★");
                 turnLabel.setForeground(Color.GREEN);
@@ -549,7 +573,7 @@ public class GameUI extends JFrame {
             turnLabel.setForeground(Color.BLACK);
         }
         
-        boardPanel.repaint();
+        boardPanel.refreshChangedCells();
     }
     
     /**
@@ -561,11 +585,9 @@ public class GameUI extends JFrame {
      * 2. Créer un nouveau timer qui se déclenche toutes les 500ms
      * 3. À chaque déclenchement :
      *    - Vérifier si le jeu n'est pas terminé
-     *    - Obtenir les IA pour le joueur actuel (Minimax ou MC)
-     *    - Exécuter bestMove()
-     *    - Appliquer le coup au plateau
-     *    - Alterner les joueurs
-     *    - Rafraîchir l'affichage
+     *    - Attendre si le coup précédent est encore en cours de calcul
+     *    - Sinon lancer la recherche de l'IA au trait en arrière-plan (startIASearch),
+     *      qui applique le coup, alterne les joueurs et rafraîchit l'affichage
      * 4. Arrêter le timer à la fin du jeu
      */
     private void playIAvsIA() {
@@ -584,39 +606,12 @@ public class GameUI extends JFrame {
                     return;
                 }
                 
-                List<Move> legalMoves = board.legalMoves(board.getCurrentPlayer());
-                if (legalMoves.isEmpty()) {
-                    iaTimer.stop();
-                    updateDisplay();
+                // Le coup précédent est encore en cours de calcul
+                if (iaSearch != null && !iaSearch.isDone()) {
                     return;
                 }
                 
-                Move move = null;
-                long startTime = System.currentTimeMillis();
-                
-                if (board.getCurrentPlayer() == 'w') {
-                    if (whiteMC != null) {
-                        move = whiteMC.bestMove(board);
-                    } else if (whiteIA != null) {
-                        move = whiteIA.bestMove(board);
-                    }
-                } else {
-                    if (blackMC != null) {
-                        move = blackMC.bestMove(board);
-                    } else if (blackIA != null) {
-                        move = blackIA.bestMove(board);
-                    }
-                }
-                
-                long elapsed = System.currentTimeMillis() - startTime;
-                System.out.println(String.format("%s joue en %dms", 
-                    board.getCurrentPlayer() == 'w' ? "Blancs" : "Noirs", elapsed));
-                
-                if (move != null) {
-                    board.applyMove(move);
-                    board.setCurrentPlayer(board.getCurrentPlayer() == 'w' ? 'b' : 'w');
-                    updateDisplay();
-                } else {
+                if (!startIASearch()) {
                     iaTimer.stop();
                 }
             }
@@ -645,38 +640,78 @@ public class GameUI extends JFrame {
      * 
      * Processus :
      * 1. Vérifier que le jeu n'est pas terminé
-     * 2. Obtenir l'IA pour le joueur actuel (Minimax ou MC)
-     * 3. Exécuter bestMove() pour obtenir le meilleur coup
-     * 4. Appliquer le coup au plateau
-     * 5. Alterner au joueur suivant
-     * 6. Rafraîchir l'affichage
+     * 2. Lancer la recherche de l'IA au trait en arrière-plan (startIASearch),
+     *    qui applique ensuite le coup, alterne au joueur suivant et rafraîchit l'affichage
      */
     private void playIATurn() {
         if (board.isTerminalWithDraw()) {
             return;
         }
         
-        Move move = null;
-        
-        if (board.getCurrentPlayer() == 'w') {
-            if (whiteMC != null) {
-                move = whiteMC.bestMove(board);
-            } else if (whiteIA != null) {
-                move = whiteIA.bestMove(board);
-            }
-        } else {
-            if (blackMC != null) {
-                move = blackMC.bestMove(board);
-            } else if (blackIA != null) {
-                move = blackIA.bestMove(board);
-            }
+        // Une recherche abandonnée (nouvelle partie, annulation) n'est pas encore terminée : réessayer plus tard
+        if (iaSearch != null && !iaSearch.isDone()) {
+            scheduleIAMove();
+            return;
         }
         
-        if (move != null) {
-            board.applyMove(move);
-            board.setCurrentPlayer(board.getCurrentPlayer() == 'w' ? 'b' : 'w');
-            updateDisplay();
+        startIASearch();
+    }
+    
+    /**
+     * Lance la recherche du coup de l'IA au trait dans un thread d'arrière-plan (SwingWorker),
+     * sur une copie du plateau : l'interface reste réactive pendant que l'IA réfléchit.
+     * À la fin de la recherche, de retour sur le thread EDT, le coup est appliqué au plateau,
+     * le trait passe au joueur suivant et l'affichage est rafraîchi, sauf si la partie a
+     * changé entre-temps (nouvelle partie, changement de mode, annulation).
+     * 
+     * @return true si une recherche a été lancée, false si aucune IA ne joue ce camp
+     */
+    private boolean startIASearch() {
+        char player = board.getCurrentPlayer();
+        IA ia = player == 'w' ? whiteIA : blackIA;
+        IA_MC mc = player == 'w' ? whiteMC : blackMC;
+        if (ia == null && mc == null) {
+            return false;
         }
+        
+        Board searchBoard = board.copy();
+        int generation = searchGeneration;
+        long startTime = System.currentTimeMillis();
+        
+        iaSearch = new SwingWorker<Move, Void>() {
+            @Override
+            protected Move doInBackground() {
+                return mc != null ? mc.bestMove(searchBoard) : ia.bestMove(searchBoard);
+            }
+            
+            @Override
+            protected void done() {
+                Move move;
+                try {
+                    move = get();
+                } catch (InterruptedException | java.util.concurrent.ExecutionException e) {
+                    e.printStackTrace();
+                    return;
+                }
+                if (generation != searchGeneration) {
+                    return;
+                }
+                
+                long elapsed = System.currentTimeMillis() - startTime;
+                System.out.println(String.format("%s joue en %dms", 
+                    player == 'w' ? "Blancs" : "Noirs", elapsed));
+                
+                if (move != null) {
+                    board.applyMove(move);
+                    board.setCurrentPlayer(player == 'w' ? 'b' : 'w');
+                    updateDisplay();
+                } else if (iaTimer != null) {
+                    iaTimer.stop();
+                }
+            }
+        };
+        iaSearch.execute();
+        return true;
     }
     
     /**
@@ -690,6 +725,13 @@ public class GameUI extends JFrame {
      * - Le rendu avec antialiasing pour une meilleure qualité
      */
     private class BoardPanel extends JPanel {
+        /** Damier et coordonnées, dessinés une seule fois puis recopiés à chaque rendu */
+        private BufferedImage background;
+        /** Contenu des cases lors du dernier rafraîchissement */
+        private byte[] lastCells;
+        /** Cases surlignées lors du dernier rendu */
+        private final boolean[] lastHighlighted = new boolean[BOARD_SIZE * BOARD_SIZE];
+        
         /**
          * Constructeur du panneau du plateau.
          * Configure :
@@ -748,11 +790,11 @@ public class GameUI extends JFrame {
          * @param col La colonne cliquée (0-9)
          */
         private void handleClick(int row, int col) {
-            Piece clicked = board.getPiece(row, col);
+            byte clicked = board.getPiece(row, col);
             
             if (selectedRow == -1) {
                 // Premier clic - sélectionner une pièce
-                if (clicked != null && Character.toLowerCase(clicked.getCode()) == board.getCurrentPlayer()) {
+                if (clicked != Piece.EMPTY && Piece.color(clicked) == board.getCurrentPlayer()) {
                     selectedRow = row;
                     selectedCol = col;
                     availableMoves = board.legalMoves(board.getCurrentPlayer());
@@ -801,6 +843,83 @@ public class GameUI extends JFrame {
             }
         }
         
+        /**
+         * Redemande le rendu des seules cases modifiées depuis le dernier rafraîchissement :
+         * cases dont le contenu a changé et cases surlignées avant ou après le coup.
+         * Swing regroupe ces zones en une seule demande de rendu.
+         */
+        public void refreshChangedCells() {
+            byte[] cells = board.getCells();
+            if (lastCells == null) {
+                lastCells = cells.clone();
+                repaint();
+                return;
+            }
+            boolean[] highlighted = highlightedCells();
+            for (int sq = 0; sq < cells.length; sq++) {
+                if (cells[sq] != lastCells[sq] || lastHighlighted[sq] || highlighted[sq]) {
+                    repaintCell(sq / BOARD_SIZE, sq % BOARD_SIZE);
+                }
+            }
+            System.arraycopy(cells, 0, lastCells, 0, cells.length);
+        }
+        
+        /**
+         * Demande le rendu d'une seule case.
+         * 
+         * @param row La ligne de la case (0-9)
+         * @param col La colonne de la case (0-9)
+         */
+        private void repaintCell(int row, int col) {
+            repaint(col * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE);
+        }
+        
+        /**
+         * Calcule les cases à surligner : pièce sélectionnée et destinations possibles.
+         * 
+         * @return Un tableau indexé par case (ligne * 10 + colonne)
+         */
+        private boolean[] highlightedCells() {
+            boolean[] highlighted = new boolean[BOARD_SIZE * BOARD_SIZE];
+            if (selectedRow != -1) {
+                highlighted[selectedRow * BOARD_SIZE + selectedCol] = true;
+                if (availableMoves != null) {
+                    for (Move m : availableMoves) {
+                        highlighted[m.endRow * BOARD_SIZE + m.endCol] = true;
+                    }
+                }
+            }
+            return highlighted;
+        }
+        
+        /**
+         * Dessine une seule fois le damier et les coordonnées dans une image.
+         * 
+         * @return L'image de fond du plateau
+         */
+        private BufferedImage buildBackground() {
+            int size = CELL_SIZE * BOARD_SIZE;
+            BufferedImage image = new BufferedImage(size, size, BufferedImage.TYPE_INT_RGB);
+            Graphics2D g2d = image.createGraphics();
+            g2d.setRenderingHint(RenderingHints.KEY_TEXT_ANTIALIASING, RenderingHints.VALUE_TEXT_ANTIALIAS_ON);
+            
+            for (int r = 0; r < BOARD_SIZE; r++) {
+                for (int c = 0; c < BOARD_SIZE; c++) {
+                    g2d.setColor((r + c) % 2 == 0 ? LIGHT_SQUARE : DARK_SQUARE);
+                    g2d.fillRect(c * CELL_SIZE, r * CELL_SIZE, CELL_SIZE, CELL_SIZE);
+                }
+            }
+            
+            g2d.setColor(Color.DARK_GRAY);
+            g2d.setFont(COORD_FONT);
+            for (int i = 0; i < BOARD_SIZE; i++) {
+                g2d.drawString(String.valueOf(i), i * CELL_SIZE + 3, 12);
+                g2d.drawString(String.valueOf(i), 3, i * CELL_SIZE + 12);
+            }
+            g2d.dispose();
+            return image;
+        }
+        
         /**
          * Redessine le panneau du plateau avec tous les éléments visuels.
          * Processus de rendu :
@@ -812,6 +931,7 @@ public class GameUI extends JFrame {
          * 2. COORDONNÉES
          *    - Chiffres 0-9 sur les bords (lignes et colonnes)
          *    - Aide pour lire les positions
+         *    - Grille et coordonnées sont dessinées une fois dans une image de fond
          * 
          * 3. SURBRILLANCE
          *    - Pièce sélectionnée en jaune
@@ -822,6 +942,7 @@ public class GameUI extends JFrame {
          *    - Dames : mêmes que pions mais avec une couronne dorée (♔ symbole)
          *    - Ombres sous les pièces pour l'effet 3D
          *    - Bordure sombre autour de chaque pièce
+         *    - Seules les cases de la zone à redessiner sont parcourues
          */
         @Override
         protected void paintComponent(Graphics g) {
@@ -829,71 +950,61 @@ public class GameUI extends JFrame {
             Graphics2D g2d = (Graphics2D) g;
             g2d.setRenderingHint(RenderingHints.KEY_ANTIALIASING, RenderingHints.VALUE_ANTIALIAS_ON);
             
-            // Dessiner le plateau
-            for (int r = 0; r < BOARD_SIZE; r++) {
-                for (int c = 0; c < BOARD_SIZE; c++) {
-                    if ((r + c) % 2 == 0) {
-                        g2d.setColor(new Color(240, 217, 181));
-                    } else {
-                        g2d.setColor(new Color(181, 136, 99));
-                    }
-                    g2d.fillRect(c * CELL_SIZE, r * CELL_SIZE, CELL_SIZE, CELL_SIZE);
-                }
+            // Recopier le plateau et les coordonnées
+            if (background == null) {
+                background = buildBackground();
             }
+            g2d.drawImage(background, 0, 0, null);
             
-            // Dessiner les coordonnées
-            g2d.setColor(Color.DARK_GRAY);
-            g2d.setFont(new Font("Arial", Font.PLAIN, 10));
-            for (int i = 0; i < BOARD_SIZE; i++) {
-                g2d.drawString(String.valueOf(i), i * CELL_SIZE + 3, 12);
-                g2d.drawString(String.valueOf(i), 3, i * CELL_SIZE + 12);
+            // Limiter le rendu aux cases touchées par la zone à redessiner
+            Rectangle clip = g2d.getClipBounds();
+            int minRow = 0, maxRow = BOARD_SIZE - 1, minCol = 0, maxCol = BOARD_SIZE - 1;
+            if (clip != null) {
+                minRow = Math.max(0, clip.y / CELL_SIZE);
+                maxRow = Math.min(BOARD_SIZE - 1, (clip.y + clip.height - 1) / CELL_SIZE);
+                minCol = Math.max(0, clip.x / CELL_SIZE);
+                maxCol = Math.min(BOARD_SIZE - 1, (clip.x + clip.width - 1) / CELL_SIZE);
             }
             
-            // Surligner la pièce sélectionnée
-            if (selectedRow != -1) {
-                g2d.setColor(new Color(255, 255, 0, 100));
-                g2d.fillRect(selectedCol * CELL_SIZE, selectedRow * CELL_SIZE, CELL_SIZE, CELL_SIZE);
-                
-                // Surligner les coups possibles
-                if (availableMoves != null) {
-                    g2d.setColor(new Color(0, 255, 0, 100));
-                    for (Move m : availableMoves) {
-                        g2d.fillRect(m.endCol * CELL_SIZE, m.endRow * CELL_SIZE, CELL_SIZE, CELL_SIZE);
-                    }
+            // Surligner la pièce sélectionnée et les coups possibles
+            boolean[] highlighted = highlightedCells();
+            for (int sq = 0; sq < highlighted.length; sq++) {
+                if (highlighted[sq]) {
+                    int r = sq / BOARD_SIZE;
+                    int c = sq % BOARD_SIZE;
+                    g2d.setColor(r == selectedRow && c == selectedCol ? SELECTED_HIGHLIGHT : MOVE_HIGHLIGHT);
+                    g2d.fillRect(c * CELL_SIZE, r * CELL_SIZE, CELL_SIZE, CELL_SIZE);
                 }
             }
+            System.arraycopy(highlighted, 0, lastHighlighted, 0, highlighted.length);
             
             // Dessiner les pièces
-            Piece[][] grid = board.getGrid();
-            for (int r = 0; r < BOARD_SIZE; r++) {
-                for (int c = 0; c < BOARD_SIZE; c++) {
-                    Piece p = grid[r][c];
-                    if (p != null) {
+            byte[] cells = board.getCells();
+            g2d.setStroke(PIECE_STROKE);
+            g2d.setFont(CROWN_FONT);
+            for (int r = minRow; r <= maxRow; r++) {
+                for (int c = minCol; c <= maxCol; c++) {
+                    byte p = cells[r * BOARD_SIZE + c];
+                    if (p != Piece.EMPTY) {
                         int x = c * CELL_SIZE + CELL_SIZE / 2;
                         int y = r * CELL_SIZE + CELL_SIZE / 2;
                         int radius = CELL_SIZE / 3;
                         
                         // Dessiner l'ombre de la pièce
-                        g2d.setColor(new Color(0, 0, 0, 50));
+                        g2d.setColor(PIECE_SHADOW);
                         g2d.fillOval(x - radius + 2, y - radius + 2, radius * 2, radius * 2);
                         
                         // Dessiner la pièce
-                        if (p.isWhite()) {
-                            g2d.setColor(Color.WHITE);
-                        } else {
-                            g2d.setColor(new Color(50, 50, 50));
-                        }
+                        g2d.setColor(Piece.isWhite(p) ? Color.WHITE : BLACK_PIECE);
                         g2d.fillOval(x - radius, y - radius, radius * 2, radius * 2);
                         
                         // Dessiner la bordure
                         g2d.setColor(Color.DARK_GRAY);
-                        g2d.setStroke(new BasicStroke(2));
                         g2d.drawOval(x - radius, y - radius, radius * 2, radius * 2);
                         
                         // Dessiner la couronne pour les dames
-                        if (p.isDame()) {
-                            g2d.setColor(new Color(255, 215, 0));
-                            g2d.setFont(new Font("Arial", Font.BOLD, 24));
+                        if (Piece.isDame(p)) {
+                            g2d.setColor(CROWN_COLOR);
                             String crown = "♛";
                             FontMetrics fm = g2d.getFontMetrics();
                             int textX = x - fm.stringWidth(crown) / 2;
@@ -906,24 +1017,6 @@ public class GameUI extends JFrame {
         }
     }
     
-    /**
-     * Classe interne pour sauvegarde d'état du plateau.
-     * Stocke une copie du plateau pour permettre l'annulation de coups.
-     * 
-     * Utilisage :
-     * 1. Avant chaque coup humain, créer et empiler un snapshot
-     * 2. Si l'humain clique sur "Annuler", dépiler et restaurer le dernier snapshot
-     * 
-     * Important : Le plateau est copié (pas de référence) pour éviter les pb de modification.
-     */
-    private static class BoardSnapshot {
-        Board board;
-        
-        BoardSnapshot(Board board) {
-            this.board = board;
-        }
-    }
-    
     /**
      * Point d'entrée du programme.
      * 
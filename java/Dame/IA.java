@@ -23,12 +23,31 @@ import java.util.*;
  * @version 1.0
  */
 public class IA {
-    /** Couleur de l'IA ('w' ou 'b') */
+    /**
+     * Couleur jouée par l'IA lors de la dernière recherche ('w' ou 'b'), fixée par bestMove.
+     * Ne sert qu'à compter les coupures : scores, table de transposition et cache d'évaluation
+     * sont relatifs au joueur au trait, si bien qu'une même IA peut jouer les deux couleurs.
+     */
     private char myColor;
     /** Profondeur maximale de recherche */
     private int maxDepth;
-    /** Table de transposition pour mémoriser les positions évaluées */
-    private Map<String, CacheEntry> transpositionTable;
+    /** Nombre de cases de la table de transposition (puissance de 2) */
+    private static final int TT_SIZE = 1 << 18;
+    /**
+     * Table de transposition pour mémoriser les positions évaluées, adressée directement par
+     * les bits de poids faible de la clé de Zobrist (remplacement systématique en cas de collision).
+     * Conservée d'un coup et d'une partie à l'autre.
+     */
+    private CacheEntry[] transpositionTable;
+    /** Nombre de cases du cache d'évaluation (puissance de 2) */
+    private static final int EVAL_CACHE_SIZE = 1 << 18;
+    /**
+     * Cache d'évaluation adressé directement par la clé de Zobrist : clés et scores (pour le joueur
+     * au trait) des dernières positions évaluées, remplacés en cas de collision. Les poids étant
+     * propres à l'IA, la clé de position suffit. Conservé d'un coup et d'une partie à l'autre.
+     */
+    private long[] evalKeys;
+    private double[] evalScores;
     /** Générateur de nombres aléatoires pour choisir entre coups égaux */
     private Random random;
     
@@ -40,9 +59,66 @@ public class IA {
     private int alphaCutoffs;
     /** Nombre de coupures beta */
     private int betaCutoffs;
+    /** Nombre de recherches complètes relancées après l'échec d'une fenêtre nulle (PVS) */
+    private int reSearches;
+    
+    /** Nombre maximal de demi-coups suivis pour les coups killers */
+    private static final int MAX_PLY = 64;
+    /** Coups killers : clés (Move.key) de deux coups calmes ayant provoqué une coupure, par demi-coup depuis la racine (0 = aucun) */
+    private long[][] killers;
+    /** Heuristique d'historique : bonus cumulé des coups calmes ayant provoqué une coupure, indexé [départ][arrivée] */
+    private int[][] history;
+    /** Clés de Zobrist des positions du chemin de recherche courant (détection des répétitions) */
+    private Set<Long> searchPath;
+    /** Nombre maximal de positions dans le cache des coups légaux (vidé au-delà) */
+    private static final int MOVE_CACHE_LIMIT = 1 << 14;
+    /** Coups légaux déjà générés pendant la recherche courante, par clé de Zobrist (trait inclus), vidé à la fin de la recherche */
+    private Map<Long, List<Move>> moveCache;
+    /** Meilleur coup de l'itération précédente, essayé en premier à la racine */
+    private Move pvMove;
+    /** Coups de la racine triés par score à l'itération précédente (ordre des coups suivants à la racine) */
+    private List<Move> rootOrder;
     
     /** Poids des heuristiques selon le profil sélectionné */
     private Map<String, Double> weights;
+    /**
+     * Table pièce-case : somme pondérée des heuristiques qui ne dépendent que de la pièce et de sa case
+     * (matériel, centre, promotion, tempo, blocages), indexée [code de pièce][case à plat].
+     * La ligne Piece.EMPTY est nulle. Calculée une fois à partir des poids du profil.
+     */
+    private double[][] pieceSquareTable;
+    /** Demi-largeur de la fenêtre d'aspiration autour du score de l'itération précédente (un demi-pion de matériel) */
+    private double aspirationWindow;
+    /** Poids des heuristiques qui dépendent des pièces voisines, lus une fois dans weights */
+    private double structureWeight, mobilityWeight, dameActivityWeight, safetyWeight;
+    
+    /** Score d'une partie gagnée (le joueur au trait sans coup légal a perdu) */
+    private static final double WIN_SCORE = 10000.0;
+    /**
+     * Borne finie de la fenêtre alpha-beta, bien au-delà de tout score réel (victoire et évaluations
+     * restent sous INF / 2) : les fenêtres nulles autour d'elle (Math.nextUp/nextDown) restent finies.
+     */
+    private static final double INF = 1.0e9;
+    
+    /** Type d'entrée : score exact (la valeur est dans la fenêtre alpha-beta) */
+    private static final int EXACT = 0;
+    /** Type d'entrée : borne inférieure (coupure, le vrai score est au moins égal) */
+    private static final int LOWER_BOUND = 1;
+    /** Type d'entrée : borne supérieure (aucun coup n'a dépassé alpha) */
+    private static final int UPPER_BOUND = 2;
+    
+    /** Les 4 directions diagonales (dr, dc), partagées par les heuristiques au lieu d'être recréées à chaque appel */
+    private static final int[][] DIAGONALS = {{-1,-1}, {-1,1}, {1,-1}, {1,1}};
+    /** Diagonales où chercher le soutien d'un pion noir (voir pawnStructure) */
+    private static final int[][] BLACK_SUPPORT = {{1,1}, {1,-1}};
+    /** Diagonales où chercher le soutien d'un pion blanc */
+    private static final int[][] WHITE_SUPPORT = {{-1,1}, {-1,-1}};
+    
+    /** Positions de coin problématiques pour une dame (difficiles à défendre, mobilité limitée) */
+    private static final int[][] LOCK_SQUARES = {
+        {0,1}, {1,0}, {0,3}, {3,0}, // Coin haut-gauche
+        {9,8}, {8,9}, {9,6}, {6,9}  // Coin bas-droit
+    };
     
     // Zones centrales
     private static final Set<String> CENTER = new HashSet<>(Arrays.asList("4,4", "4,5", "5,4", "5,5"));
@@ -77,15 +153,55 @@ public class IA {
         this.myColor = myColor;
         this.maxDepth = maxDepth;
         // Table de transposition pour cacher les résultats d'evaluations
-        this.transpositionTable = new HashMap<>();
+        this.transpositionTable = new CacheEntry[TT_SIZE];
+        // Cache des évaluations statiques (feuilles de la recherche)
+        this.evalKeys = new long[EVAL_CACHE_SIZE];
+        this.evalScores = new double[EVAL_CACHE_SIZE];
+        // Tables d'ordre des coups (killers par demi-coup, historique par case de départ/arrivée)
+        this.killers = new long[MAX_PLY][2];
+        this.history = new int[100][100];
+        this.searchPath = new HashSet<>();
+        this.rootOrder = new ArrayList<>();
+        this.moveCache = new HashMap<>();
         // Générateur aléatoire pour résoudre les égalités
         this.random = new Random();
         // Charger les poids heuristiques du profil sélectionné
-        this.weights = getProfileWeights(profile);
+        loadWeights(profile);
         // Initialiser les compteurs de performance
         resetCounters();
     }
     
+    /**
+     * Change le profil de l'IA (pour "Poids Random", de nouveaux poids sont tirés), ce qui permet
+     * de réutiliser une instance et ses tables au lieu d'en allouer une nouvelle.
+     * Les scores mémorisés dépendent des poids : table de transposition et cache d'évaluation sont vidés.
+     * 
+     * @param profile Profil de jeu parmi les 8 styles disponibles
+     */
+    public void setProfile(String profile) {
+        loadWeights(profile);
+        Arrays.fill(transpositionTable, null);
+        Arrays.fill(evalKeys, 0L);
+        Arrays.fill(evalScores, 0.0);
+    }
+    
+    /**
+     * Charge les poids du profil et précalcule ce qui en dépend (poids des heuristiques dynamiques,
+     * fenêtre d'aspiration, table pièce-case).
+     * 
+     * @param profile Profil de jeu parmi les 8 styles disponibles
+     */
+    private void loadWeights(String profile) {
+        this.weights = getProfileWeights(profile);
+        this.structureWeight = weights.get("structure");
+        this.mobilityWeight = weights.get("mobility");
+        this.dameActivityWeight = weights.get("Dame_activity");
+        this.safetyWeight = weights.get("safety");
+        this.aspirationWindow = Math.max(1.0, 0.5 * weights.get("material"));
+        // Précalculer la partie pièce-case de l'évaluation
+        this.pieceSquareTable = buildPieceSquareTable();
+    }
+    
     /**
      * Charge les poids des heuristiques pour un profil donné.
      * Les poids déterminent le style de jeu et la priorité accordée à chaque aspect du jeu.
@@ -228,6 +344,8 @@ public class IA {
         alphaCutoffs = 0;
         // Nombre de coupures bêta effectuées
         betaCutoffs = 0;
+        // Nombre de recherches relancées par PVS
+        reSearches = 0;
     }
     
     /**
@@ -262,6 +380,15 @@ public class IA {
         return betaCutoffs; 
     }
     
+    /**
+     * Retourne le nombre de recherches relancées par PVS (fenêtre nulle dépassée).
+     * Un nombre faible devant celui des nœuds indique un bon ordre des coups.
+     * @return Compteur de recherches relancées
+     */
+    public int getReSearches() {
+        return reSearches;
+    }
+    
     /**
      * Détermine le meilleur coup à jouer dans la position actuelle.
      * Utilise la recherche itérative approfondie pour explorer progressivement de plus en plus profond.
@@ -270,10 +397,22 @@ public class IA {
      * @return Le meilleur coup trouvé
      */
     public Move bestMove(Board board) {
+        // L'IA joue pour le camp au trait
+        myColor = board.getCurrentPlayer();
         // Réinitialiser les compteurs pour cette recherche
         resetCounters();
-        // Vider la table de transposition (ne pas réutiliser les données de la recherche précédente)
-        transpositionTable.clear();
+        // La table de transposition est conservée : les positions des recherches précédentes
+        // (finales à peu de pièces notamment) reviennent souvent
+        // Repartir de tables d'ordre des coups vides
+        for (long[] slots : killers) {
+            Arrays.fill(slots, 0L);
+        }
+        for (int[] row : history) {
+            Arrays.fill(row, 0);
+        }
+        pvMove = null;
+        rootOrder.clear();
+        searchPath.clear();
         // Lancer la recherche avec recherche itérative approfondie
         return iterativeDeepening(board);
     }
@@ -288,93 +427,148 @@ public class IA {
      */
     private Move iterativeDeepening(Board board) {
         Move bestMove = null;
+        // Score de l'itération précédente (aucun avant la profondeur 1)
+        double previousScore = 0.0;
         
         // Rechercher progressivement de plus en plus profond
         for (int depth = 1; depth <= maxDepth; depth++) {
-            // Lancer une recherche Minimax à cette profondeur
-            MinimaxResult result = minimax(board, depth, Double.NEGATIVE_INFINITY, 
-                                          Double.POSITIVE_INFINITY, true);
+            MinimaxResult result;
+            if (depth == 1) {
+                // Lancer une recherche Minimax à cette profondeur
+                result = negamax(board, depth, 0, -INF, INF);
+            } else {
+                // Fenêtre d'aspiration : le score change peu d'une profondeur à l'autre, une fenêtre
+                // étroite autour du précédent provoque plus de coupures
+                double alpha = previousScore - aspirationWindow;
+                double beta = previousScore + aspirationWindow;
+                result = negamax(board, depth, 0, alpha, beta);
+                // Score hors de la fenêtre : ce n'est qu'une borne, relancer avec la fenêtre complète
+                if (result.score <= alpha || result.score >= beta) {
+                    result = negamax(board, depth, 0, -INF, INF);
+                }
+            }
+            previousScore = result.score;
             // Mettre à jour le meilleur coup trouvé
             if (result.move != null) {
                 bestMove = result.move;
+                // Il sera essayé en premier à l'itération suivante
+                pvMove = bestMove;
             }
         }
         
         // Afficher les statistiques de la recherche
-        System.out.println(String.format("IA Stats - Nodes: %d, Cache hits: %d, Alpha cutoffs: %d, Beta cutoffs: %d",
-                          nodesVisited, cacheHits, alphaCutoffs, betaCutoffs));
+        System.out.println(String.format("IA Stats - Nodes: %d, Cache hits: %d, Alpha cutoffs: %d, Beta cutoffs: %d, PVS re-searches: %d",
+                          nodesVisited, cacheHits, alphaCutoffs, betaCutoffs, reSearches));
         
+        // Les coups mémorisés ne valent que pour cette recherche : ne pas les garder en mémoire
+        // jusqu'au prochain appel (une IA peut rester inactive longtemps, en tournoi notamment)
+        moveCache.clear();
         return bestMove;
     }
     
     /**
-     * Oriente un score selon la couleur de l'IA.
-     * Les scores bruts ont les noirs positifs et blancs négatifs.
-     * Cette méthode transforme le score pour que positif = bon pour l'IA, négatif = mauvais pour l'IA.
-     * 
-     * @param rawValue Score brut du plateau
-     * @return Score orienté selon la couleur de l'IA
-     */
-    private double orient(double rawValue) {
-        // Si l'IA est noire, garder le score tel quel (noirs positifs)
-        // Si l'IA est blanche, inverser le score (blancs positifs)
-        return (myColor == 'b') ? rawValue : -rawValue;
-    }
-    
-    /**
-     * Implémente l'algorithme Minimax avec élagage Alpha-Beta et table de transposition.
+     * Implémente l'algorithme Minimax sous forme Negamax avec élagage Alpha-Beta (fail-soft),
+     * recherche à fenêtre nulle (PVS) et table de transposition.
      * Cette méthode est le cœur de l'IA : elle explore l'arbre de jeu en profondeur.
      * 
      * Fonctionnement :
-     * - maximizing=true : cherche le meilleur coup pour l'IA (valeur maximale)
-     * - maximizing=false : cherche le pire coup pour l'adversaire (valeur minimale)
-     * - Alpha-Beta pruning : coupe les branches non prometteuses pour gagner du temps
-     * - Table de transposition : mémorise les positions déjà évaluées
+     * - Les scores sont toujours du point de vue du joueur au trait : le score d'un enfant
+     *   est l'opposé de son score pour l'adversaire, un seul cas à traiter au lieu de max/min
+     * - PVS : le premier coup (le mieux classé) est cherché avec la fenêtre complète, les suivants
+     *   avec une fenêtre nulle qui vérifie seulement qu'ils ne font pas mieux ; un coup qui
+     *   dépasse quand même est recherché à nouveau avec la fenêtre complète
+     * - Quiescence : à profondeur 0, les prises obligatoires sont encore jouées jusqu'à une position calme
+     * - Fail-soft : le score retourné peut sortir de la fenêtre, ce qui donne des bornes plus serrées
+     * - Table de transposition : mémorise les positions déjà évaluées, avec la profondeur
+     *   de recherche et le type de score (exact, borne inférieure ou supérieure)
      * 
      * @param board L'état du plateau
      * @param depth Profondeur restante de recherche
-     * @param alpha Meilleure valeur trouvée pour le joueur maximisant
-     * @param beta Meilleure valeur trouvée pour le joueur minimisant
-     * @param maximizing true si on maximise (tour de l'IA), false si on minimise (tour adverse)
-     * @return Un objet contenant le score et le meilleur coup trouvé
+     * @param ply Nombre de demi-coups joués depuis la racine
+     * @param alpha Score que le joueur au trait est déjà sûr d'obtenir
+     * @param beta Score au-delà duquel l'adversaire évitera cette position
+     * @return Un objet contenant le score (pour le joueur au trait) et le meilleur coup trouvé
      */
-    private MinimaxResult minimax(Board board, int depth, double alpha, double beta, boolean maximizing) {
+    private MinimaxResult negamax(Board board, int depth, int ply, double alpha, double beta) {
         // Incrémenter le compteur de nœuds visités
         nodesVisited++;
         
-        // OPTIMISATION 1 : Vérifier si la position est déjà évaluée (cache/transposition table)
-        String key = getCacheKey(board, depth, maximizing);
-        if (transpositionTable.containsKey(key)) {
-            // Utiliser le résultat en cache au lieu de re-calculer
-            cacheHits++;
-            CacheEntry entry = transpositionTable.get(key);
-            return new MinimaxResult(entry.score, entry.move);
+        long key = board.getZobristKey();
+        
+        // Une position déjà rencontrée sur le chemin courant est une répétition : score nul
+        // (l'historique officiel du plateau n'est pas modifié pendant la recherche)
+        if (ply > 0 && searchPath.contains(key)) {
+            return new MinimaxResult(0.0, null);
         }
         
-        // CONDITION D'ARRÊT 1 : Profondeur limite atteinte
-        // CONDITION D'ARRÊT 2 : Position terminale (quelqu'un a gagné ou c'est un nul)
-        if (depth == 0 || board.isTerminal()) {
-            // Évaluer cette position avec toutes les heuristiques
-            double score = evaluate(board);
-            return new MinimaxResult(score, null);
+        // Mémoriser la fenêtre d'origine pour typer le score stocké en fin de recherche
+        double alphaOrig = alpha;
+        
+        // OPTIMISATION 1 : Vérifier si la position est déjà évaluée (cache/transposition table)
+        // La clé de Zobrist inclut le trait, auquel le score mémorisé est relatif
+        // La case peut contenir une autre position : la clé complète est comparée
+        CacheEntry entry = transpositionTable[(int) key & (TT_SIZE - 1)];
+        Move ttMove = null;
+        if (entry != null && entry.key == key) {
+            // Le meilleur coup mémorisé sert à l'ordre des coups même si l'entrée est trop peu profonde
+            ttMove = entry.move;
+            // La racine est toujours recherchée, pour garder le tirage au sort entre coups égaux
+            if (ply > 0 && entry.depth >= depth) {
+                // Utiliser le résultat en cache au lieu de re-calculer
+                cacheHits++;
+                if (entry.flag == EXACT) {
+                    return new MinimaxResult(entry.score, entry.move);
+                } else if (entry.flag == LOWER_BOUND) {
+                    alpha = Math.max(alpha, entry.score);
+                } else {
+                    beta = Math.min(beta, entry.score);
+                }
+                // La borne suffit à couper ce nœud
+                if (alpha >= beta) {
+                    return new MinimaxResult(entry.score, entry.move);
+                }
+            }
         }
         
-        // Récupérer tous les coups légaux pour le joueur actuel
-        List<Move> moves = board.legalMoves(board.getCurrentPlayer());
+        // Récupérer tous les coups légaux pour le joueur actuel (depuis le cache si la position est déjà connue)
+        List<Move> moves = generateMoves(board);
+        // CONDITION D'ARRÊT 1 : Position terminale (aucun coup légal = défaite pour le joueur actuel)
         if (moves.isEmpty()) {
-            // Aucun coup légal = défaite pour le joueur actuel
-            double score = evaluate(board);
-            return new MinimaxResult(score, null);
+            return new MinimaxResult(-WIN_SCORE, null);
+        }
+        // CONDITION D'ARRÊT 2 : Profondeur limite atteinte dans une position calme
+        // Recherche de quiescence : si une prise est à jouer (elles sont obligatoires, la liste ne
+        // contient alors que des prises), on continue à profondeur 0 jusqu'à une position calme,
+        // pour ne pas évaluer au milieu d'un échange (effet d'horizon)
+        if (depth <= 0 && !moves.get(0).isCapture()) {
+            // Évaluer cette position avec toutes les heuristiques
+            return new MinimaxResult(evaluate(board), null);
         }
+        // Profondeur des enfants (reste à 0 pendant la quiescence, qui se termine car chaque prise retire des pièces)
+        int childDepth = Math.max(0, depth - 1);
         
         // OPTIMISATION 2 : Classer les coups pour mieux élaguer les branches
-        // Les captures sont testées en premier (meilleur élagage)
-        moves = orderMoves(board, moves, depth, maximizing);
+        // À la racine, le meilleur coup de l'itération précédente remplace un coup de cache absent
+        if (ply == 0 && ttMove == null) {
+            ttMove = pvMove;
+        }
+        moves = orderMoves(board, moves, ply, ttMove);
+        
+        // À la racine, les coups à égalité avec le meilleur sont tous gardés pour un tirage au sort.
+        // Leur score doit alors être exact : la fenêtre nulle y est placée juste sous alpha,
+        // si bien qu'un coup égal au meilleur provoque une recherche complète au lieu d'être écarté.
+        boolean root = (ply == 0);
         
         // Liste des meilleurs coups en cas d'égalité de score
         List<Move> bestMoves = new ArrayList<>();
         // Initialiser avec la pire valeur possible
-        double bestScore = maximizing ? Double.NEGATIVE_INFINITY : Double.POSITIVE_INFINITY;
+        double bestScore = -INF;
+        boolean firstMove = true;
+        // Scores des coups de la racine, pour ordonner l'itération suivante
+        List<MoveScore> rootScores = root ? new ArrayList<>() : null;
+        
+        // Ajouter la position au chemin pour la durée de l'exploration de ses enfants
+        searchPath.add(key);
         
         // Boucle sur tous les coups possibles
         for (Move move : moves) {
@@ -384,56 +578,68 @@ public class IA {
             // Passer au joueur suivant
             board.setCurrentPlayer(oldPlayer == 'w' ? 'b' : 'w');
             
-            // APPEL RÉCURSIF : Évaluer la position après ce coup
-            // Réduire la profondeur, inverser maximizing
-            MinimaxResult result = minimax(board, depth - 1, alpha, beta, !maximizing);
-            double score = result.score;
+            // APPEL RÉCURSIF : Évaluer la position après ce coup (score de l'adversaire, inversé)
+            double score;
+            if (firstMove) {
+                // Variation principale : fenêtre complète
+                score = -negamax(board, childDepth, ply + 1, -beta, -alpha).score;
+            } else {
+                // Fenêtre nulle : le coup fait-il mieux que le meilleur actuel ?
+                double low = root ? Math.nextDown(alpha) : alpha;
+                score = -negamax(board, childDepth, ply + 1, -Math.nextUp(low), -low).score;
+                if (score > low && score < beta) {
+                    // Oui : le rechercher à nouveau pour connaître son score exact.
+                    // La fenêtre repart de low et non du score de la fenêtre nulle : ce score n'est
+                    // qu'une borne, et une recherche resserrée pourrait échouer bas et rendre une borne
+                    // là où la racine a besoin d'un score exact pour départager les coups égaux
+                    reSearches++;
+                    score = -negamax(board, childDepth, ply + 1, -beta, -low).score;
+                }
+            }
+            firstMove = false;
             
             // Restaurer l'état du plateau
             board.setCurrentPlayer(oldPlayer);
             board.undoMove(undo);
             
-            // LOGIQUE MINIMAX
-            if (maximizing) {
-                // Chercher le score MAXIMUM
-                if (score > bestScore) {
-                    // Nouveau meilleur coup trouvé
-                    bestScore = score;
-                    bestMoves.clear();
-                    bestMoves.add(move);
-                }
-                else if (score == bestScore) {
-                    // Score égal au meilleur
-                    bestMoves.add(move);
-                }
-                
-                // ALPHA-BETA : Mettre à jour alpha
-                alpha = Math.max(alpha, score);
-                // Si beta <= alpha, on peut couper les autres branches
-                if (beta <= alpha) {
-                    alphaCutoffs++; // Compter la coupure
-                    break; // Sortir de la boucle (élagage)
-                }
-            } else {
-                // Chercher le score MINIMUM
-                if (score < bestScore) {
-                    // Nouveau meilleur coup trouvé
-                    bestScore = score;
-                    bestMoves.clear();
-                    bestMoves.add(move);
-                }
-                else if (score == bestScore) {
-                    // Score égal au meilleur
-                    bestMoves.add(move);
-                }
-                
-                // ALPHA-BETA : Mettre à jour beta
-                beta = Math.min(beta, score);
-                // Si beta <= alpha, on peut couper les autres branches
-                if (beta <= alpha) {
-                    betaCutoffs++; // Compter la coupure
-                    break; // Sortir de la boucle (élagage)
+            if (root) {
+                rootScores.add(new MoveScore(move, score));
+            }
+            
+            if (score > bestScore) {
+                // Nouveau meilleur coup trouvé
+                bestScore = score;
+                bestMoves.clear();
+                bestMoves.add(move);
+            }
+            else if (root && score == bestScore) {
+                // Score égal au meilleur
+                bestMoves.add(move);
+            }
+            
+            // ALPHA-BETA : Mettre à jour alpha
+            alpha = Math.max(alpha, score);
+            // Si beta <= alpha, on peut couper les autres branches
+            if (beta <= alpha) {
+                // Compter la coupure (alpha si l'IA est au trait, beta sinon)
+                if (oldPlayer == myColor) {
+                    alphaCutoffs++;
+                } else {
+                    betaCutoffs++;
                 }
+                recordCutoff(move, depth, ply);
+                break; // Sortir de la boucle (élagage)
+            }
+        }
+        
+        searchPath.remove(key);
+        
+        if (root) {
+            // Tri stable : à score égal (bornes de la fenêtre nulle), l'ordre de cette itération est gardé
+            rootScores.sort((a, b) -> Double.compare(b.score, a.score));
+            rootOrder.clear();
+            for (MoveScore ms : rootScores) {
+                rootOrder.add(ms.move);
             }
         }
         
@@ -442,91 +648,104 @@ public class IA {
         Move chosenMove = bestMoves.isEmpty() ? null : bestMoves.get(random.nextInt(bestMoves.size()));
         
         // OPTIMISATION : Stocker ce résultat en cache pour ne pas le recalculer
-        transpositionTable.put(key, new CacheEntry(bestScore, chosenMove));
+        // Un score hors de la fenêtre d'origine n'est qu'une borne
+        int flag;
+        if (bestScore <= alphaOrig) {
+            flag = UPPER_BOUND;
+        } else if (bestScore >= beta) {
+            flag = LOWER_BOUND;
+        } else {
+            flag = EXACT;
+        }
+        // Remplacement systématique : l'entrée occupant la case est réutilisée
+        int slot = (int) key & (TT_SIZE - 1);
+        CacheEntry stored = transpositionTable[slot];
+        if (stored == null) {
+            transpositionTable[slot] = new CacheEntry(key, bestScore, chosenMove, depth, flag);
+        } else {
+            stored.set(key, bestScore, chosenMove, depth, flag);
+        }
         
         // Retourner le score et le meilleur coup trouvé
         return new MinimaxResult(bestScore, chosenMove);
     }
     
-    /**
-     * Crée une clé unique pour une position dans la table de transposition.
-     * Cette clé identifie de manière unique une position + profondeur + contexte.
-     * 
-     * Format de la clé : hashCode_depth_maximizing_myColor
-     * - hashCode du plateau identifie la position
-     * - depth différencie les recherches à différentes profondeurs
-     * - maximizing distingue les nœuds maximisants et minimisants
-     * - myColor s'assure que l'IA ne réutilise pas les valeurs d'une couleur opposée
-     * 
-     * @param board L'état du plateau
-     * @param depth Profondeur actuelle de recherche
-     * @param maximizing true si c'est un nœud maximisant
-     * @return Une chaîne unique identifiant cette position
-     */
-    private String getCacheKey(Board board, int depth, boolean maximizing) {
-        // Combiner le hachage du plateau, la profondeur, le contexte et la couleur
-        return board.hashCode() + "_" + depth + "_" + maximizing + "_" + myColor;
-    }
-    
     /**
      * Évalue une position de jeu en utilisant les 9 heuristiques pondérées.
      * C'est la fonction d'évaluation complète qui combine tous les aspects du jeu.
      * 
      * Processus :
-     * 1. Si la position est terminale (quelqu'un a gagné), retourner un score extrême
-     * 2. Sinon, calculer un score brut en combinant les 9 heuristiques avec leurs poids
-     * 3. Orienter le score selon la couleur de l'IA
+     * 1. Calculer un score brut en combinant les 9 heuristiques avec leurs poids
+     * 2. Orienter le score vers le joueur au trait, comme l'attend Negamax
+     * 
+     * Les positions terminales ne sont pas évaluées ici : Negamax les reconnaît à
+     * l'absence de coup légal et leur donne directement le score -WIN_SCORE.
      * 
      * Les 9 heuristiques sont pondérées différemment selon le profil sélectionné :
      * - matériel, contrôle du centre, structure de pions
      * - mobilité, activité des dames, potentiel de promotion
      * - sécurité des pièces, tempo (avance), positions de blocage
      * 
+     * Une position déjà évaluée (même clé de Zobrist, trait inclus) est relue dans le cache d'évaluation.
+     * 
      * @param board L'état du plateau à évaluer
-     * @return Un score numérique (positif = bon pour l'IA, négatif = mauvais)
+     * @return Un score numérique (positif = bon pour le joueur au trait, négatif = mauvais)
      */
     private double evaluate(Board board) {
-        // ÉVALUATION DES POSITIONS TERMINALES
-        if (board.isTerminal()) {
-            // Déterminer le gagnant
-            char winner = board.winner();
-            // Score brut (noir positif, blanc négatif)
-            double raw;
-            if (winner == 'w') {
-                raw = -10000.0; // Blanc gagne = très bon pour blancs, très mauvais pour noirs
-            } else if (winner == 'b') {
-                raw = 10000.0; // Noir gagne = très bon pour noirs, très mauvais pour blancs
-            } else {
-                raw = 0.0; // Nul = neutre
-            }
-            // IMPORTANT : Orienter le score terminal aussi !
-            return orient(raw);
+        long key = board.getZobristKey();
+        int slot = (int) key & (EVAL_CACHE_SIZE - 1);
+        if (evalKeys[slot] == key) {
+            return evalScores[slot];
         }
         
-        // ÉVALUATION DES POSITIONS NON-TERMINALES
         // Score brut (noir positif, blanc négatif)
         double raw = 0.0;
         
-        // Ajouter la contribution de chaque heuristique multipliée par son poids
-        raw += weights.get("material") * material(board);
-        raw += weights.get("central") * centralControl(board);
-        raw += weights.get("structure") * pawnStructure(board);
-        raw += weights.get("mobility") * mobility(board);
-        raw += weights.get("Dame_activity") * DameActivity(board);
-        raw += weights.get("promotion") * promotionPotential(board);
-        raw += weights.get("safety") * pieceSafety(board);
-        raw += weights.get("tempo") * tempo(board);
-        raw += weights.get("locks") * lockPositions(board);
+        // Matériel, centre, promotion, tempo et blocages : une lecture de table par case
+        byte[] cells = board.getCells();
+        for (int sq = 0; sq < cells.length; sq++) {
+            raw += pieceSquareTable[cells[sq]][sq];
+        }
+        
+        // Ajouter la contribution des autres heuristiques multipliée par leur poids
+        raw += structureWeight * pawnStructure(board);
+        raw += mobilityWeight * mobility(board);
+        raw += dameActivityWeight * DameActivity(board);
+        raw += safetyWeight * pieceSafety(board);
         
-        // Orientation du score selon la couleur de l'IA
-        // Transforme le score pour que positif = bon pour l'IA
-        return orient(raw);
+        // Orientation du score : positif = bon pour le joueur au trait
+        double score = board.getCurrentPlayer() == 'b' ? raw : -raw;
+        evalKeys[slot] = key;
+        evalScores[slot] = score;
+        return score;
+    }
+    
+    /**
+     * Construit la table pièce-case à partir des poids du profil.
+     * Pour chaque code de pièce et chaque case, additionne les heuristiques qui ne dépendent
+     * que de la pièce et de sa case, multipliées par leur poids (score brut, noirs positifs).
+     * 
+     * @return La table [code de pièce][case à plat]
+     */
+    private double[][] buildPieceSquareTable() {
+        double[][] table = new double[5][100];
+        for (byte p = Piece.W_PAWN; p <= Piece.B_QUEEN; p++) {
+            for (int r = 0; r < 10; r++) {
+                for (int c = 0; c < 10; c++) {
+                    table[p][r * 10 + c] = weights.get("material") * materialValue(p)
+                                         + weights.get("central") * centralValue(p, r, c)
+                                         + weights.get("promotion") * promotionValue(p, r)
+                                         + weights.get("tempo") * tempoValue(p, r)
+                                         + weights.get("locks") * lockValue(p, r, c);
+                }
+            }
+        }
+        return table;
     }
     
     /**
      * Heuristique 1 : MATÉRIEL
-     * Calcule la différence de pièces entre noirs et blancs.
-     * Un pion vaut 1 point, une dame vaut 3 points (meilleure mobilité).
+     * Valeur d'une pièce : un pion vaut 1 point, une dame vaut 3 points (meilleure mobilité).
      * 
      * Calcul du score brut (avant orientation) :
      * - Score noir positif : + valeur des pions/dames noirs
@@ -534,27 +753,13 @@ public class IA {
      * 
      * Exemple : 20 pions noirs vs 18 pions blancs = score brut de +2
      * 
-     * @param board L'état du plateau
-     * @return Différence matériel (noirs positifs, blancs négatifs)
+     * @param p Le code de la pièce (non vide)
+     * @return Valeur de la pièce (noirs positifs, blancs négatifs)
      */
-    private double material(Board board) {
-        double val = 0.0;
-        Piece[][] grid = board.getGrid();
-        
-        // Parcourir tout le plateau
-        for (int r = 0; r < 10; r++) {
-            for (int c = 0; c < 10; c++) {
-                Piece p = grid[r][c];
-                if (p == null) continue; // Case vide
-                
-                // Déterminer la valeur : dame=3, pion=1
-                double v = p.isDame() ? 3.0 : 1.0;
-                // Ajouter ou soustraire selon la couleur
-                val += p.isBlack() ? v : -v;
-            }
-        }
-        
-        return val;
+    private static double materialValue(byte p) {
+        // Déterminer la valeur : dame=3, pion=1
+        double v = Piece.isDame(p) ? 3.0 : 1.0;
+        return Piece.isBlack(p) ? v : -v;
     }
     
     /**
@@ -567,37 +772,23 @@ public class IA {
      * - LARGE_CENTRE (16 cases) : bonus +1 par pièce
      * - Autres cases : bonus 0
      * 
-     * @param board L'état du plateau
-     * @return Score de contrôle du centre (noirs positifs, blancs négatifs)
+     * @param p Le code de la pièce (non vide)
+     * @param r Ligne de la pièce
+     * @param c Colonne de la pièce
+     * @return Bonus de centre de la pièce (noirs positifs, blancs négatifs)
      */
-    private double centralControl(Board board) {
-        double score = 0.0;
-        Piece[][] grid = board.getGrid();
+    private static double centralValue(byte p, int r, int c) {
+        String pos = r + "," + c;
+        double bonus = 0.0;
         
-        // Parcourir tout le plateau
-        for (int r = 0; r < 10; r++) {
-            for (int c = 0; c < 10; c++) {
-                Piece p = grid[r][c];
-                if (p == null) continue; // Case vide
-                
-                String pos = r + "," + c;
-                double bonus = 0.0;
-                
-                // Déterminer le bonus selon la zone
-                if (CENTER.contains(pos)) {
-                    bonus = 3.0; // Centre pur
-                } else if (WIDE_CENTER.contains(pos)) {
-                    bonus = 1.0; // Centre large
-                }
-                
-                // Ajouter le bonus au score
-                if (bonus > 0) {
-                    score += p.isBlack() ? bonus : -bonus;
-                }
-            }
+        // Déterminer le bonus selon la zone
+        if (CENTER.contains(pos)) {
+            bonus = 3.0; // Centre pur
+        } else if (WIDE_CENTER.contains(pos)) {
+            bonus = 1.0; // Centre large
         }
         
-        return score;
+        return Piece.isBlack(p) ? bonus : -bonus;
     }
     
     /**
@@ -617,35 +808,34 @@ public class IA {
      */
     private double pawnStructure(Board board) {
         double score = 0.0;
-        Piece[][] grid = board.getGrid();
+        byte[] cells = board.getCells();
         int size = 10;
         
         // Parcourir tous les pions
         for (int r = 0; r < size; r++) {
             for (int c = 0; c < size; c++) {
-                Piece p = grid[r][c];
+                byte p = cells[r * 10 + c];
                 // Ignorer les cases vides et les dames (qui ont une mobilité complète)
-                if (p == null || p.isDame()) continue;
+                if (p == Piece.EMPTY || Piece.isDame(p)) continue;
                 
                 // ===== ISOLEMENT =====
                 // Vérifier si le pion a au moins un allié adjacent (sur les 4 diagonales)
                 boolean isolated = true;
-                int[][] neighbors = {{-1,-1}, {-1,1}, {1,-1}, {1,1}};
-                for (int i=0; i<neighbors.length && isolated; i++) {
-                    int[] dir = neighbors[i];
+                for (int i=0; i<DIAGONALS.length && isolated; i++) {
+                    int[] dir = DIAGONALS[i];
                     int nr = r + dir[0];
                     int nc = c + dir[1];
                     if (nr >= 0 && nr < size && nc >= 0 && nc < size) {
-                        Piece q = grid[nr][nc];
+                        byte q = cells[nr * 10 + nc];
                         // Vérifier qu'il y a un allié (même couleur)
-                        if (q != null && !p.areOpponents(q)) {
+                        if (q != Piece.EMPTY && !Piece.areOpponents(p, q)) {
                             isolated = false;
                         }
                     }
                 }
                 // Pénaliser les pions isolés
                 if (isolated) {
-                    score += p.isBlack() ? -2.0 : 2.0;
+                    score += Piece.isBlack(p) ? -2.0 : 2.0;
                 }
                 
                 // ===== SOUTIEN =====
@@ -653,22 +843,22 @@ public class IA {
                 boolean support = false;
                 // Si noir (avance vers bas), regarder les diagonales bas
                 // Si blanc (avance vers haut), regarder les diagonales haut
-                int[][] checks = p.isBlack() ? new int[][]{{1,1}, {1,-1}} : new int[][]{{-1,1}, {-1,-1}};
+                int[][] checks = Piece.isBlack(p) ? BLACK_SUPPORT : WHITE_SUPPORT;
                 for (int i=0; i<checks.length && !support; i++) {
                     int[] dir = checks[i];
                     int nr = r + dir[0];
                     int nc = c + dir[1];
                     if (nr >= 0 && nr < size && nc >= 0 && nc < size) {
-                        Piece q = grid[nr][nc];
+                        byte q = cells[nr * 10 + nc];
                         // Vérifier qu'il y a un allié
-                        if (q != null && !p.areOpponents(q)) {
+                        if (q != Piece.EMPTY && !Piece.areOpponents(p, q)) {
                             support = true;
                         }
                     }
                 }
                 // Bonuser les pions soutenus
                 if (support) {
-                    score += p.isBlack() ? 2.0 : -2.0;
+                    score += Piece.isBlack(p) ? 2.0 : -2.0;
                 }
             }
         }
@@ -692,20 +882,11 @@ public class IA {
      * @return Score de mobilité (noirs positifs, blancs négatifs)
      */
     private double mobility(Board board) {
-        // Sauvegarder le joueur actuel pour le restaurer après
-        char currentPlayer = board.getCurrentPlayer();
-        
-        // Compter les coups légaux des noirs
-        board.setCurrentPlayer('b');
+        // Compter les coups légaux de chaque camp (legalMoves prend le joueur en paramètre :
+        // inutile de changer le trait, ce qui modifierait aussi la clé de Zobrist)
         int blackMoves = board.legalMoves('b').size();
-        
-        // Compter les coups légaux des blancs
-        board.setCurrentPlayer('w');
         int whiteMoves = board.legalMoves('w').size();
         
-        // Restaurer le joueur actuel
-        board.setCurrentPlayer(currentPlayer);
-        
         // Retourner la différence
         return blackMoves - whiteMoves;
     }
@@ -727,15 +908,15 @@ public class IA {
      */
     private double DameActivity(Board board) {
         double score = 0.0;
-        Piece[][] grid = board.getGrid();
+        byte[] cells = board.getCells();
         int size = 10;
         
         // Parcourir tout le plateau
         for (int r = 0; r < size; r++) {
             for (int c = 0; c < size; c++) {
-                Piece p = grid[r][c];
+                byte p = cells[r * 10 + c];
                 // Ignorer les cases vides et les pions (ils ne participent pas à cette heuristique)
-                if (p == null || !p.isDame()) continue;
+                if (p == Piece.EMPTY || !Piece.isDame(p)) continue;
                 
                 // ===== DISTANCE DU BORD =====
                 // Une dame au centre est meilleure qu'une dame en coin
@@ -744,24 +925,23 @@ public class IA {
                     Math.min(c, size - 1 - c)            // Min distance gauche/droite
                 );
                 // Ajouter cette distance au score
-                score += p.isBlack() ? distEdge : -distEdge;
+                score += Piece.isBlack(p) ? distEdge : -distEdge;
                 
                 // ===== CASES LIBRES SUR LES DIAGONALES =====
                 // Compter combien de cases libres sont disponibles sur les 4 diagonales
                 int freeSteps = 0;
-                int[][] dirs = {{-1,-1}, {-1,1}, {1,-1}, {1,1}};
-                for (int[] dir : dirs) {
+                for (int[] dir : DIAGONALS) {
                     int nr = r + dir[0];
                     int nc = c + dir[1];
                     // Avancer tant qu'on reste dans le plateau et que la case est libre
-                    while (nr >= 0 && nr < size && nc >= 0 && nc < size && grid[nr][nc] == null) {
+                    while (nr >= 0 && nr < size && nc >= 0 && nc < size && cells[nr * 10 + nc] == Piece.EMPTY) {
                         freeSteps++;
                         nr += dir[0];
                         nc += dir[1];
                     }
                 }
                 // Ajouter les cases libres (avec coefficient 0.2 car moins important que distance du bord)
-                score += (p.isBlack() ? freeSteps * 0.2 : -freeSteps * 0.2);
+                score += (Piece.isBlack(p) ? freeSteps * 0.2 : -freeSteps * 0.2);
             }
         }
         
@@ -780,35 +960,23 @@ public class IA {
      * Exemple : Un pion noir à la ligne 8 (1 case avant promotion) = +9 points
      * Exemple : Un pion blanc à la ligne 1 (8 cases avant promotion) = -9 points
      * 
-     * @param board L'état du plateau
-     * @return Score de potentiel de promotion (noirs positifs, blancs négatifs)
+     * @param p Le code de la pièce (non vide)
+     * @param r Ligne de la pièce
+     * @return Potentiel de promotion de la pièce (noirs positifs, blancs négatifs)
      */
-    private double promotionPotential(Board board) {
-        double score = 0.0;
-        Piece[][] grid = board.getGrid();
+    private static double promotionValue(byte p, int r) {
         int size = 10;
+        // Ignorer les dames (qui sont déjà promues)
+        if (Piece.isDame(p)) return 0.0;
         
-        // Parcourir tous les pions
-        for (int r = 0; r < size; r++) {
-            for (int c = 0; c < size; c++) {
-                Piece p = grid[r][c];
-                // Ignorer les cases vides et les dames (qui sont déjà promues)
-                if (p == null || p.isDame()) continue;
-                
-                // Les noirs avancent vers le bas (ligne 9 = promotion)
-                if (p.isBlack()) {
-                    int dist = (size - 1) - r; // Distance jusqu'à la ligne 9
-                    score += (size - dist); // Plus proche = plus élevé
-                } 
-                // Les blancs avancent vers le haut (ligne 0 = promotion)
-                else {
-                    int dist = r; // Distance jusqu'à la ligne 0
-                    score -= (size - dist); // Plus proche = plus bas (négatif)
-                }
-            }
+        // Les noirs avancent vers le bas (ligne 9 = promotion)
+        if (Piece.isBlack(p)) {
+            int dist = (size - 1) - r; // Distance jusqu'à la ligne 9
+            return size - dist; // Plus proche = plus élevé
         }
-        
-        return score;
+        // Les blancs avancent vers le haut (ligne 0 = promotion)
+        int dist = r; // Distance jusqu'à la ligne 0
+        return -(size - dist); // Plus proche = plus bas (négatif)
     }
     
     /**
@@ -821,18 +989,18 @@ public class IA {
      */
     private double pieceSafety(Board board) {
         double score = 0.0;
-        Piece[][] grid = board.getGrid();
+        byte[] cells = board.getCells();
         
         // Parcourir tout le plateau
         for (int r = 0; r < 10; r++) {
             for (int c = 0; c < 10; c++) {
-                Piece p = grid[r][c];
-                if (p == null) continue;
+                byte p = cells[r * 10 + c];
+                if (p == Piece.EMPTY) continue;
                 
                 // Vérifier si cette pièce est capturable sans risque
                 if (squareIsHanging(board, r, c)) {
                     // Pénaliser fortement les pièces en l'air (-4)
-                    score += p.isBlack() ? -4.0 : 4.0;
+                    score += Piece.isBlack(p) ? -4.0 : 4.0;
                 }
             }
         }
@@ -851,13 +1019,13 @@ public class IA {
      * @return true si la pièce peut être capturée, false sinon
      */
     private boolean squareIsHanging(Board board, int r, int c) {
-        Piece piece = board.getGrid()[r][c];
-        if (piece == null) return false;
+        byte[] cells = board.getCells();
+        byte piece = cells[r * 10 + c];
+        if (piece == Piece.EMPTY) return false;
         
         int size = 10;
         // Parcourir les 4 diagonales
-        int[][] dirs = {{-1,-1}, {-1,1}, {1,-1}, {1,1}};
-        for (int[] dir : dirs) {
+        for (int[] dir : DIAGONALS) {
             // Position de la pièce ennemie potentielle
             int mr = r + dir[0];
             int mc = c + dir[1];
@@ -869,9 +1037,9 @@ public class IA {
             if (mr < 0 || mr >= size || mc < 0 || mc >= size) continue;
             if (ar < 0 || ar >= size || ac < 0 || ac >= size) continue;
             
-            Piece q = board.getGrid()[mr][mc];
+            byte q = cells[mr * 10 + mc];
             // Vérifier : (1) il y a une pièce ennemie (2) la case d'arrivée est libre
-            if (q != null && q.areOpponents(piece) && board.getGrid()[ar][ac] == null) {
+            if (Piece.areOpponents(q, piece) && cells[ar * 10 + ac] == Piece.EMPTY) {
                 return true; // Cette pièce peut être capturée
             }
         }
@@ -888,33 +1056,21 @@ public class IA {
      * - Pour chaque pion noir : score = +ligne (avance vers ligne 9)
      * - Pour chaque pion blanc : score = -(9-ligne) (avance vers ligne 0)
      * 
-     * @param board L'état du plateau
-     * @return Score de tempo (noirs positifs, blancs négatifs)
+     * @param p Le code de la pièce (non vide)
+     * @param r Ligne de la pièce
+     * @return Tempo de la pièce (noirs positifs, blancs négatifs)
      */
-    private double tempo(Board board) {
-        double score = 0.0;
-        Piece[][] grid = board.getGrid();
+    private static double tempoValue(byte p, int r) {
         int size = 10;
+        // Ignorer les dames
+        if (Piece.isDame(p)) return 0.0;
         
-        // Parcourir tous les pions
-        for (int r = 0; r < size; r++) {
-            for (int c = 0; c < size; c++) {
-                Piece p = grid[r][c];
-                // Ignorer les cases vides et les dames
-                if (p == null || p.isDame()) continue;
-                
-                // Noirs avancent vers le bas : récompenser l'avance
-                if (p.isBlack()) {
-                    score += r; // Plus r est grand, plus le pion est avancé
-                } 
-                // Blancs avancent vers le haut : récompenser l'avance
-                else {
-                    score -= ((size - 1) - r); // Plus r est petit, plus le pion est avancé
-                }
-            }
+        // Noirs avancent vers le bas : récompenser l'avance
+        if (Piece.isBlack(p)) {
+            return r; // Plus r est grand, plus le pion est avancé
         }
-        
-        return score;
+        // Blancs avancent vers le haut : récompenser l'avance
+        return -((size - 1) - r); // Plus r est petit, plus le pion est avancé
     }
     
     /**
@@ -922,40 +1078,72 @@ public class IA {
      * Pénalise les dames "enterrées" dans les coins difficiles du plateau.
      * Les positions de coin limitent la mobilité des dames.
      * 
-     * Positions de coins problématiques :
+     * Positions de coins problématiques (LOCK_SQUARES) :
      * - (0,1), (1,0), (0,3), (3,0) : coin haut-gauche
      * - (9,8), (8,9), (9,6), (6,9) : coin bas-droit
      * 
      * Une dame dans une position de coin = -8 pour noirs, +8 pour blancs
      * 
-     * @param board L'état du plateau
-     * @return Score de positions de blocage (noirs positifs, blancs négatifs)
+     * @param p Le code de la pièce (non vide)
+     * @param r Ligne de la pièce
+     * @param c Colonne de la pièce
+     * @return Pénalité de blocage de la pièce (noirs positifs, blancs négatifs)
      */
-    private double lockPositions(Board board) {
-        double score = 0.0;
-        Piece[][] grid = board.getGrid();
-        
-        // Positions de coin problématiques (difficiles à défendre, mobilité limitée)
-        int[][] cornersLike = {
-            {0,1}, {1,0}, {0,3}, {3,0}, // Coin haut-gauche
-            {9,8}, {8,9}, {9,6}, {6,9}  // Coin bas-droit
-        };
+    private static double lockValue(byte p, int r, int c) {
+        // Uniquement les dames sont affectées (les pions peuvent s'y échapper par promotion)
+        if (!Piece.isDame(p)) return 0.0;
         
-        // Parcourir les positions de coin
-        for (int[] pos : cornersLike) {
-            int r = pos[0];
-            int c = pos[1];
-            if (r < 0 || r >= 10 || c < 0 || c >= 10) continue;
-            
-            Piece p = grid[r][c];
-            // Uniquement les dames sont affectées (les pions peuvent s'y échapper par promotion)
-            if (p != null && p.isDame()) {
+        for (int[] pos : LOCK_SQUARES) {
+            if (pos[0] == r && pos[1] == c) {
                 // Pénaliser fortement (-8) une dame en position de coin
-                score += p.isBlack() ? -8.0 : 8.0;
+                return Piece.isBlack(p) ? -8.0 : 8.0;
             }
         }
+        return 0.0;
+    }
+    
+    /**
+     * Retourne les coups légaux du joueur au trait, en les mémorisant pour la recherche courante.
+     * Une même position atteinte par plusieurs ordres de coups (transposition) n'est générée qu'une fois.
+     * La liste retournée est partagée : elle ne doit pas être modifiée.
+     * 
+     * @param board L'état du plateau
+     * @return La liste des coups légaux
+     */
+    private List<Move> generateMoves(Board board) {
+        long key = board.getZobristKey();
+        List<Move> moves = moveCache.get(key);
+        if (moves == null) {
+            moves = board.legalMoves(board.getCurrentPlayer());
+            // Borner la mémoire utilisée sur les recherches profondes
+            if (moveCache.size() >= MOVE_CACHE_LIMIT) {
+                moveCache.clear();
+            }
+            moveCache.put(key, moves);
+        }
+        return moves;
+    }
+    
+    /**
+     * Mémorise un coup calme ayant provoqué une coupure alpha-beta.
+     * Le coup devient killer pour ce demi-coup et gagne depth² points d'historique.
+     * Les captures ne sont pas mémorisées : elles sont déjà obligatoires et triées à part.
+     * 
+     * @param move Le coup ayant provoqué la coupure
+     * @param depth La profondeur restante au nœud coupé
+     * @param ply Le demi-coup du nœud coupé
+     */
+    private void recordCutoff(Move move, int depth, int ply) {
+        if (move.isCapture()) return;
         
-        return score;
+        // Killers : le plus récent en premier, sans doublon
+        if (ply < MAX_PLY && move.key != killers[ply][0]) {
+            killers[ply][1] = killers[ply][0];
+            killers[ply][0] = move.key;
+        }
+        
+        // Historique : les coupures profondes comptent davantage
+        history[move.startRow * 10 + move.startCol][move.endRow * 10 + move.endCol] += depth * depth;
     }
     
     /**
@@ -963,46 +1151,66 @@ public class IA {
      * Les meilleurs coups sont testés en premier pour maximiser les coupures.
      * 
      * Critères de tri (par ordre d'importance) :
-     * 1. Captures en priorité (poids = nombre de pièces capturées × 50)
-     * 2. Score réel de la table de transposition pour la position enfant (si disponible)
-     * 3. Autres mouvements
+     * 1. Meilleur coup de la table de transposition (ou de l'itération précédente à la racine)
+     * 2. À la racine, rang du coup à l'itération précédente (score décroissant)
+     * 3. Promotion d'un pion en dame
+     * 4. Coups killers de ce demi-coup (ont déjà provoqué une coupure dans une position sœur)
+     * 5. Score d'historique (coupures cumulées du même déplacement départ → arrivée)
+     * 6. Nombre de pièces capturées
+     * À score égal, le tri (stable) garde l'ordre de Board.legalMoves, qui place
+     * les rafles prenant des dames ou promouvant un pion en premier.
      * 
-     * Exemple : Un coup qui capture 2 pièces (+100) et mène à une position en cache de score +30
-     * obtient un score d'ordre de 130.
+     * Aucun coup n'est joué pour les classer : le tri ne coûte que des lectures de tableaux.
      * 
-     * @param board L'état du plateau courant
-     * @param moves La liste des coups candidats depuis ce plateau
-     * @param depth La profondeur restante au nœud courant (l'enfant est évalué à depth-1)
-     * @param maximizing true si le nœud courant est maximisant (l'enfant est alors minimisant)
+     * @param board L'état du plateau (pour reconnaître les promotions)
+     * @param moves La liste des coups candidats
+     * @param ply Le demi-coup du nœud courant
+     * @param ttMove Meilleur coup connu pour cette position (null si aucun)
      * @return La liste de coups triée par ordre d'intérêt décroissant
      */
-    private List<Move> orderMoves(Board board, List<Move> moves, int depth, boolean maximizing) {
+    private List<Move> orderMoves(Board board, List<Move> moves, int ply, Move ttMove) {
         // Créer une liste de paires (coup, score)
         List<MoveScore> scored = new ArrayList<>();
+        long killer1 = ply < MAX_PLY ? killers[ply][0] : 0L;
+        long killer2 = ply < MAX_PLY ? killers[ply][1] : 0L;
+        long ttKey = ttMove != null ? ttMove.key : 0L;
         
         for (Move move : moves) {
             double score = 0.0;
             
-            // CRITÈRE 1 : Priorité aux captures (très importantes)
-            if (move.isCapture()) {
-                // Plus on capture de pièces, plus le coup est intéressant
-                score += move.capturedPositions.length * 50;
+            // CRITÈRE 1 : Le meilleur coup connu est essayé en premier
+            if (move.key == ttKey) {
+                score += 1.0e15;
             }
             
-            // Bonus supplémentaire si le coup mène à une position déjà évaluée (cache)
-            Board.MoveUndo undo = board.makeMove(move);
-            char oldPlayer = board.getCurrentPlayer();
-            board.setCurrentPlayer(oldPlayer == 'w' ? 'b' : 'w');
-
-            int childDepth = Math.max(0, depth - 1);
-            String key = getCacheKey(board, childDepth, !maximizing);
-            if (transpositionTable.containsKey(key)) {
-                CacheEntry entry = transpositionTable.get(key);
-                score += entry.score;   // score réel du cache
+            // CRITÈRE 2 : À la racine, les coups les mieux notés à l'itération précédente d'abord
+            if (ply == 0) {
+                int rank = rootOrder.indexOf(move);
+                if (rank >= 0) {
+                    score += 1.0e13 * (rootOrder.size() - rank);
+                }
+            }
+            
+            // CRITÈRE 3 : Un pion qui atteint la dernière rangée devient dame
+            byte piece = board.getPiece(move.startRow, move.startCol);
+            if (!Piece.isDame(piece) && move.endRow == (Piece.isWhite(piece) ? 9 : 0)) {
+                score += 1.0e14;
+            }
+            
+            // CRITÈRE 4 : Coups killers
+            if (move.key == killer1) {
+                score += 2.0e12;
+            } else if (move.key == killer2) {
+                score += 1.0e12;
+            }
+            
+            // CRITÈRE 5 : Historique
+            score += 100.0 * history[move.startRow * 10 + move.startCol][move.endRow * 10 + move.endCol];
+            
+            // CRITÈRE 6 : Plus on capture de pièces, plus le coup est intéressant
+            if (move.isCapture()) {
+                score += move.capturedPositions.length;
             }
-
-            board.setCurrentPlayer(oldPlayer);
-            board.undoMove(undo);
             
             scored.add(new MoveScore(move, score));
         }
@@ -1046,22 +1254,46 @@ public class IA {
     
     /**
      * Classe interne pour stocker une entrée dans la table de transposition.
-     * Mémorise le score et le meilleur coup pour une position donnée.
+     * Mémorise le score, son type, la profondeur de recherche et le meilleur coup pour une position donnée.
      */
     private static class CacheEntry {
+        /** Clé de Zobrist complète de la position (vérifiée à la lecture) */
+        long key;
         /** Score mémorisé pour cette position */
         double score;
         /** Meilleur coup trouvé pour cette position */
         Move move;
+        /** Profondeur restante à laquelle le score a été calculé */
+        int depth;
+        /** Type de score : EXACT, LOWER_BOUND ou UPPER_BOUND */
+        int flag;
         
         /**
          * Constructeur d'une entrée de cache.
+         * @param key La clé de Zobrist de la position
+         * @param score Le score à mémoriser
+         * @param move Le coup à mémoriser
+         * @param depth La profondeur de recherche du score
+         * @param flag Le type de score
+         */
+        CacheEntry(long key, double score, Move move, int depth, int flag) {
+            set(key, score, move, depth, flag);
+        }
+        
+        /**
+         * Remplace le contenu de l'entrée par une nouvelle position.
+         * @param key La clé de Zobrist de la position
          * @param score Le score à mémoriser
          * @param move Le coup à mémoriser
+         * @param depth La profondeur de recherche du score
+         * @param flag Le type de score
          */
-        CacheEntry(double score, Move move) {
+        void set(long key, double score, Move move, int depth, int flag) {
+            this.key = key;
             this.score = score;
             this.move = move;
+            this.depth = depth;
+            this.flag = flag;
         }
     }
     
@@ -1072,7 +1304,7 @@ public class IA {
     private static class MoveScore {
         /** Le coup à ordonner */
         Move move;
-        /** Le score d'ordre (captures > coups vers le centre > autres) */
+        /** Le score d'ordre (coup de cache > killers > historique > captures) */
         double score;
         
         /**
@@ -117,11 +117,14 @@ public class IA_MC {
     private double simulate(Board board, Move move, char startingColor) {
         // Créer une copie du plateau pour la simulation
         Board sim = board.copy();
-        // Appliquer le coup à évaluer
+        // Appliquer le coup à évaluer puis donner le trait à l'adversaire, comme après un vrai coup
+        // (la clé enregistrée par applyMove pour les répétitions suppose ce changement de trait)
+        char next = startingColor == 'w' ? 'b' : 'w';
         sim.applyMove(move);
+        sim.setCurrentPlayer(next);
         
         // Lancer une simulation complète à partir de cet état
-        char winner = rollout(sim, startingColor == 'w' ? 'b' : 'w');
+        char winner = rollout(sim, next);
         
         // Retourner le résultat orienté selon la couleur de l'IA
         if (winner == myColor) {
@@ -155,13 +158,15 @@ public class IA_MC {
             // Jouer un coup aléatoire
             board.applyMove(moves.get(random.nextInt(moves.size())));
             
-            // Vérifier si le jeu est terminé
-            if (board.isTerminal()) {
-                return board.winner();
-            }
-            
             // Passer au joueur suivant
             current = current == 'w' ? 'b' : 'w';
+            board.setCurrentPlayer(current);
+            
+            // Vérifier si le jeu est terminé (plus de coup ou nul par répétition / 25 coups)
+            char winner = board.winner();
+            if (winner != ' ') {
+                return winner == 'd' ? ' ' : winner;
+            }
         }
         
         // Limite de coups atteinte = match nul
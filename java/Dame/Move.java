@@ -18,6 +18,12 @@ public class Move {
     public int endCol;
     /** Tableau des positions [ligne, colonne] des pièces capturées pendant ce déplacement */
     public int[][] capturedPositions;
+    /**
+     * Clé compacte du déplacement, calculée à la construction : cases jouables (numérotées 0-49)
+     * de départ sur les bits 0-5, d'arrivée sur les bits 6-11, et un bit par case capturée
+     * à partir du bit 12. Jamais nulle (départ et arrivée diffèrent).
+     */
+    public final long key;
     
     /**
      * Constructeur d'un déplacement.
@@ -34,6 +40,28 @@ public class Move {
         this.endRow = endRow;
         this.endCol = endCol;
         this.capturedPositions = capturedPositions;
+        this.key = packKey(startRow, startCol, endRow, endCol, capturedPositions);
+    }
+    
+    /**
+     * Calcule la clé compacte d'un déplacement (voir le champ key).
+     * Sur une case jouable, (ligne * 10 + colonne) / 2 donne un numéro unique entre 0 et 49.
+     * 
+     * @param startRow Ligne de départ
+     * @param startCol Colonne de départ
+     * @param endRow Ligne d'arrivée
+     * @param endCol Colonne d'arrivée
+     * @param capturedPositions Positions des pièces capturées (null si aucune capture)
+     * @return La clé du déplacement
+     */
+    private static long packKey(int startRow, int startCol, int endRow, int endCol, int[][] capturedPositions) {
+        long k = (startRow * 10 + startCol) / 2 | (long) ((endRow * 10 + endCol) / 2) << 6;
+        if (capturedPositions != null) {
+            for (int[] pos : capturedPositions) {
+                k |= 1L << (12 + (pos[0] * 10 + pos[1]) / 2);
+            }
+        }
+        return k;
     }
     
     /**
@@ -45,6 +73,32 @@ public class Move {
         return capturedPositions != null && capturedPositions.length > 0;
     }
     
+    /**
+     * Compare deux déplacements par leurs coordonnées et leurs prises, via leur clé compacte.
+     * Permet de retrouver un coup mémorisé (table de transposition) parmi
+     * les coups nouvellement générés pour la même position.
+     * Deux rafles prenant les mêmes pièces dans un ordre différent ont le même effet et sont égales.
+     * 
+     * @param o L'objet à comparer
+     * @return true si les deux déplacements sont identiques, false sinon
+     */
+    @Override
+    public boolean equals(Object o) {
+        if (this == o) return true;
+        if (!(o instanceof Move)) return false;
+        return key == ((Move) o).key;
+    }
+    
+    /**
+     * Code de hachage cohérent avec equals.
+     * 
+     * @return Le code de hachage du déplacement
+     */
+    @Override
+    public int hashCode() {
+        return Long.hashCode(key);
+    }
+    
     /**
      * Retourne une représentation textuelle du déplacement.
      * Format : (startRow,startCol)->(endRow,endCol) avec liste optionnelle des captures.
@@ -1,117 +1,119 @@
 /**
- * Représente une pièce du jeu de dames.
- * Une pièce peut être un pion blanc ('w'), un pion noir ('b'),
- * une dame blanche ('W') ou une dame noire ('B').
- * 
+ * Codes des pièces du jeu de dames.
+ * Le plateau stocke les pièces sous forme d'octets dans une grille à une dimension :
+ * aucun objet n'est alloué par case, et une pièce se copie ou se compare comme un entier.
+ *
+ * Codes utilisés :
+ * - 0 : case vide
+ * - 1 : pion blanc ('w')
+ * - 2 : pion noir ('b')
+ * - 3 : dame blanche ('W')
+ * - 4 : dame noire ('B')
+ *
+ * Les codes impairs sont blancs, les codes supérieurs à 2 sont des dames.
+ *
  * @author Ulysse Ansoux
  * @author Noé Vander Schueren
  * @author Léo Maquin-Testud
  * @version 1.0
  */
-public class Piece {
-    /** Code de la pièce : 'w' (pion blanc), 'b' (pion noir), 'W' (dame blanche), 'B' (dame noire) */
-    private char code;
-    
+public final class Piece {
+    /** Case vide */
+    public static final byte EMPTY = 0;
+    /** Pion blanc ('w') */
+    public static final byte W_PAWN = 1;
+    /** Pion noir ('b') */
+    public static final byte B_PAWN = 2;
+    /** Dame blanche ('W') */
+    public static final byte W_QUEEN = 3;
+    /** Dame noire ('B') */
+    public static final byte B_QUEEN = 4;
+
+    /** Représentation textuelle de chaque code ('.' pour une case vide) */
+    private static final String CHARS = ".wbWB";
+
     /**
-     * Constructeur d'une pièce.
-     * 
-     * @param code Le code de la pièce ('w', 'b', 'W', 'B')
+     * Classe utilitaire : pas d'instance.
      */
-    public Piece(char code) {
-        this.code = code;
+    private Piece() {
     }
-    
+
     /**
-     * Retourne le code de la pièce.
-     * 
-     * @return Le code de la pièce ('w', 'b', 'W', 'B')
-     */
-    public char getCode() {
-        return code;
-    }
-    
-    /**
-     * Définit le code de la pièce.
-     * 
-     * @param code Le nouveau code de la pièce
-     */
-    public void setCode(char code) {
-        this.code = code;
-    }
-    
-    /**
-     * Vérifie si la pièce est blanche.
-     * 
+     * Vérifie si une pièce est blanche.
+     *
+     * @param code Le code de la pièce
      * @return true si la pièce est blanche (pion ou dame), false sinon
      */
-    public boolean isWhite() {
-        return Character.toLowerCase(code) == 'w';
+    public static boolean isWhite(int code) {
+        return (code & 1) == 1;
     }
-    
+
     /**
-     * Vérifie si la pièce est noire.
-     * 
+     * Vérifie si une pièce est noire.
+     *
+     * @param code Le code de la pièce
      * @return true si la pièce est noire (pion ou dame), false sinon
      */
-    public boolean isBlack() {
-        return Character.toLowerCase(code) == 'b';
+    public static boolean isBlack(int code) {
+        return code != EMPTY && (code & 1) == 0;
     }
-    
+
     /**
-     * Vérifie si la pièce est une dame.
-     * 
+     * Vérifie si une pièce est une dame.
+     *
+     * @param code Le code de la pièce
      * @return true si la pièce est une dame (blanche ou noire), false sinon
      */
-    public boolean isDame() {
-        return code == 'W' || code == 'B';
+    public static boolean isDame(int code) {
+        return code > 2;
     }
-    
+
+    /**
+     * Retourne la couleur d'une pièce.
+     *
+     * @param code Le code de la pièce (non vide)
+     * @return 'w' pour une pièce blanche, 'b' pour une pièce noire
+     */
+    public static char color(int code) {
+        return isWhite(code) ? 'w' : 'b';
+    }
+
     /**
      * Promeut un pion en dame.
      * Transforme 'w' en 'W' ou 'b' en 'B'.
-     * Utilisé quand un pion atteint la dernière rangée de l'adversaire.
+     * Les dames et les cases vides ne changent pas.
+     *
+     * @param code Le code de la pièce
+     * @return Le code de la pièce après promotion
      */
-    public void promote() {
-        // Si c'est un pion blanc, le transformer en dame blanche
-        if (code == 'w') {
-            code = 'W';
-        } 
-        // Si c'est un pion noir, le transformer en dame noire
-        else if (code == 'b') {
-            code = 'B';
+    public static byte promote(int code) {
+        if (code == W_PAWN || code == B_PAWN) {
+            return (byte) (code + 2);
         }
-        // Les dames et les pièces nulles ne changent pas
+        return (byte) code;
     }
-    
+
     /**
-     * Vérifie si cette pièce est adversaire d'une autre pièce.
-     * 
-     * @param other L'autre pièce à comparer
-     * @return true si les deux pièces sont de couleurs différentes, false sinon
+     * Vérifie si deux pièces sont adversaires.
+     *
+     * @param a Le code de la première pièce
+     * @param b Le code de la seconde pièce
+     * @return true si les deux cases sont occupées par des couleurs différentes, false sinon
      */
-    public boolean areOpponents(Piece other) {
-        if (other == null) {
+    public static boolean areOpponents(int a, int b) {
+        if (a == EMPTY || b == EMPTY) {
             return false;
         }
-        return Character.toLowerCase(this.code) != Character.toLowerCase(other.code);
-    }
-    
-    /**
-     * Crée une copie de cette pièce.
-     * 
-     * @return Une nouvelle instance de Piece avec le même code
-     */
-    public Piece copy() {
-        return new Piece(this.code);
+        return ((a ^ b) & 1) == 1;
     }
-    
+
     /**
-     * Retourne une représentation textuelle de la pièce.
-     * 
-     * @return Le code de la pièce sous forme de chaîne
+     * Retourne le caractère associé à un code ('w', 'b', 'W', 'B' ou '.').
+     *
+     * @param code Le code de la pièce
+     * @return Le caractère représentant la pièce
      */
-    @Override
-    public String toString() {
-        return String.valueOf(code);
+    public static char toChar(int code) {
+        return CHARS.charAt(code);
     }
 }
@@ -4,6 +4,7 @@ import java.awt.*;
 import java.io.*;
 import java.util.*;
 import java.util.List;
+import java.util.concurrent.*;
 
 /**
  * Interface de tournoi automatisé pour comparer les performances des différents profils d'IA.
@@ -17,6 +18,7 @@ import java.util.List;
  * - Export CSV automatique et manuel avec échappement correct des caractères spéciaux
  * - Barre de progression et journal détaillé en temps réel
  * - Configuration du nombre de parties par match (2-100, pair)
+ * - Configuration du nombre de parties jouées simultanément (une par cœur par défaut)
  * - Sélection flexible des profils participants (9 profils disponibles)
  * 
  * Les 9 profils disponibles :
@@ -48,6 +50,8 @@ public class TournoiUI extends JFrame {
     private JSpinner depthSpinner;
     /** Sélecteur du nombre de simulations pour Monte-Carlo */
     private JSpinner MCSimsSpinner;
+    /** Sélecteur du nombre de parties jouées simultanément */
+    private JSpinner workersSpinner;
     
     /** Indique si un tournoi est en cours */
     private volatile boolean running = false;
@@ -146,6 +150,7 @@ public class TournoiUI extends JFrame {
      *      La valeur doit être paire pour équilibrer les couleurs (moitié en blanc, moitié en noir)
      *    - Profondeur Minimax (1-8) : contrôle la force de recherche
      *    - Simulations MC (50-2000) : contrôle la force du Monte-Carlo
+     *    - Parties simultanées (1-64, par défaut une par cœur) : nombre de threads du tournoi
      * 
      * @return Le panneau de configuration avec tous les contrôles
      */
@@ -181,6 +186,12 @@ public class TournoiUI extends JFrame {
         MCSimsSpinner = new JSpinner(new SpinnerNumberModel(300, 50, 2000, 50));
         optionsPanel.add(MCSimsSpinner);
         
+        optionsPanel.add(Box.createHorizontalStrut(20));
+        optionsPanel.add(new JLabel("Parties simultanées:"));
+        int cores = Math.min(64, Runtime.getRuntime().availableProcessors());
+        workersSpinner = new JSpinner(new SpinnerNumberModel(cores, 1, 64, 1));
+        optionsPanel.add(workersSpinner);
+        
         JButton selectAllBtn = new JButton("Tout sélectionner");
         selectAllBtn.addActionListener(e -> {
             for (JCheckBox cb : profileCheckboxes) cb.setSelected(true);
@@ -234,6 +245,7 @@ public class TournoiUI extends JFrame {
         int gamesPerMatch = (Integer) gamesPerMatchSpinner.getValue();
         int depth = (Integer) depthSpinner.getValue();
         int MCSims = (Integer) MCSimsSpinner.getValue();
+        int workers = (Integer) workersSpinner.getValue();
         
         // Initialiser le tableau
         tableModel.setRowCount(0);
@@ -244,7 +256,7 @@ public class TournoiUI extends JFrame {
         stopButton.setEnabled(true);
         
         // Lancer le tournoi dans un thread séparé
-        manager = new tournoiManager(selectedProfiles, gamesPerMatch, depth, MCSims);
+        manager = new tournoiManager(selectedProfiles, gamesPerMatch, depth, MCSims, workers);
         new Thread(() -> {
             manager.runtournoi(this);
             SwingUtilities.invokeLater(() -> {
@@ -304,7 +316,9 @@ public class TournoiUI extends JFrame {
     
     /**
      * Met à jour le tableau des résultats du tournoi.
-     * Cette méthode est appelée après chaque partie pour afficher les statistiques en temps réel.
+     * Cette méthode est appelée après chaque lot de parties terminées pour afficher les statistiques en temps réel.
+     * Les lignes sont calculées sur le thread appelant (seul à modifier les statistiques),
+     * le thread EDT ne fait que remplacer le contenu du tableau.
      * 
      * Colonnes affichées :
      * - Profil : nom du profil d'IA
@@ -319,39 +333,44 @@ public class TournoiUI extends JFrame {
      * @param stats Map des statistiques pour chaque profil
      */
     public void updateResults(Map<String, ProfileStats> stats) {
-        SwingUtilities.invokeLater(() -> {
-            tableModel.setRowCount(0);
+        // Trier par points décroissants
+        List<Map.Entry<String, ProfileStats>> sorted = new ArrayList<>(stats.entrySet());
+        sorted.sort((a, b) -> Integer.compare(b.getValue().getPoints(), a.getValue().getPoints()));
+        
+        // Instantané des lignes, indépendant des statistiques qui continuent d'évoluer
+        List<Object[]> rows = new ArrayList<>();
+        for (Map.Entry<String, ProfileStats> entry : sorted) {
+            String profile = entry.getKey();
+            ProfileStats s = entry.getValue();
             
-            // Trier par points décroissants
-            List<Map.Entry<String, ProfileStats>> sorted = new ArrayList<>(stats.entrySet());
-            sorted.sort((a, b) -> Integer.compare(b.getValue().getPoints(), a.getValue().getPoints()));
+            double winRate = s.totalGames > 0 ? (s.wins * 100.0 / s.totalGames) : 0;
+            double avgMoves = s.totalGames > 0 ? (s.totalMoves * 1.0 / s.totalGames) : 0;
+            double avgTime = s.totalMoves > 0 ? (s.totalMoveTime * 1.0 / s.totalMoves) : 0;
+            double avgNodes = s.totalMoves > 0 ? (s.totalNodesVisited * 1.0 / s.totalMoves) : 0;
             
-            for (Map.Entry<String, ProfileStats> entry : sorted) {
-                String profile = entry.getKey();
-                ProfileStats s = entry.getValue();
-                
-                double winRate = s.totalGames > 0 ? (s.wins * 100.0 / s.totalGames) : 0;
-                double avgMoves = s.totalGames > 0 ? (s.totalMoves * 1.0 / s.totalGames) : 0;
-                double avgTime = s.totalMoves > 0 ? (s.totalMoveTime * 1.0 / s.totalMoves) : 0;
-                double avgNodes = s.totalMoves > 0 ? (s.totalNodesVisited * 1.0 / s.totalMoves) : 0;
-                
-                tableModel.addRow(new Object[] {
-                    profile,
-                    s.wins,
-                    s.winsAsWhite,
-                    s.winsAsBlack,
-                    s.losses,
-                    s.lossesAsWhite,
-                    s.lossesAsBlack,
-                    s.draws,
-                    s.drawsAsWhite,
-                    s.drawsAsBlack,
-                    String.format("%.1f%%", winRate),
-                    String.format("%.1f", avgMoves),
-                    String.format("%.1f", avgTime),
-                    String.format("%.0f", avgNodes),
-                    s.getPoints()
-                });
+            rows.add(new Object[] {
+                profile,
+                s.wins,
+                s.winsAsWhite,
+                s.winsAsBlack,
+                s.losses,
+                s.lossesAsWhite,
+                s.lossesAsBlack,
+                s.draws,
+                s.drawsAsWhite,
+                s.drawsAsBlack,
+                String.format("%.1f%%", winRate),
+                String.format("%.1f", avgMoves),
+                String.format("%.1f", avgTime),
+                String.format("%.0f", avgNodes),
+                s.getPoints()
+            });
+        }
+        
+        SwingUtilities.invokeLater(() -> {
+            tableModel.setRowCount(0);
+            for (Object[] row : rows) {
+                tableModel.addRow(row);
             }
         });
     }
@@ -539,8 +558,9 @@ class ProfileStats {
  * - Total : n×(n-1)/2 × gamesPerMatch parties
  * 
  * Thread-safety :
- * - Chaque partie est jouée complètement avant la suivante
- * - Les statistiques sont mises à jour immédiatement
+ * - Les parties sont indépendantes (plateau propre) et jouées en parallèle par un pool de threads
+ * - Chaque thread réutilise ses propres IA Minimax d'une partie à l'autre, une par profil quelle que soit la couleur (tables de transposition conservées)
+ * - Les résultats sont consommés dans l'ordre du tournoi par un seul thread, qui seul modifie les statistiques
  * - Le flag running peut être modifié par d'autres threads
  */
 // Classe pour gérer le tournoi
@@ -551,6 +571,28 @@ class tournoiManager {
     private int MCSims;
     private Map<String, ProfileStats> stats;
     private volatile boolean running = true;
+    /** Nombre de parties jouées simultanément */
+    private int workers;
+    /** Nombre maximal de coups d'une partie, au-delà duquel elle est déclarée nulle */
+    private static final int MAX_MOVES = 400;
+    /** Motif affiché pour chaque code de nul de GameResult.winner */
+    private static final Map<Character, String> DRAW_REASONS = new HashMap<>();
+    static {
+        DRAW_REASONS.put('d', "égalité règles internationales");
+        DRAW_REASONS.put('l', "limite de " + MAX_MOVES + " coups atteinte");
+    }
+    /** Nombre maximal d'IA inactives conservées par profil entre deux parties */
+    private static final int IDLE_IAS_PER_PROFILE = 2;
+    /**
+     * IA Minimax inactives, par profil, partagées par tous les threads du pool : elles sont réutilisées
+     * d'une partie à l'autre, quelle que soit leur couleur, pour conserver leur table de transposition.
+     * Chaque IA occupe plusieurs Mo (table de transposition, cache d'évaluation) : au plus
+     * IDLE_IAS_PER_PROFILE sont gardées par profil, les autres sont libérées à la fin de leur partie.
+     * Accès synchronisé par borrowIA/releaseIA.
+     */
+    private final Map<String, Deque<IA>> idleIAs = new HashMap<>();
+    /** Plateau de chaque thread du pool, remis dans la position initiale au début de chaque partie */
+    private final ThreadLocal<Board> threadBoards = ThreadLocal.withInitial(Board::new);
     
     /**
      * Constructeur du gestionnaire de tournoi.
@@ -559,13 +601,15 @@ class tournoiManager {
      * @param gamesPerMatch Nombre de parties par match (doit être pair pour équilibrer les couleurs)
      * @param depth Profondeur de recherche pour Minimax (1-8)
      * @param MCSims Nombre de simulations pour Monte-Carlo
+     * @param workers Nombre de parties jouées simultanément (au moins 1)
      */
-    public tournoiManager(List<String> profiles, int gamesPerMatch, int depth, int MCSims) {
+    public tournoiManager(List<String> profiles, int gamesPerMatch, int depth, int MCSims, int workers) {
         this.profiles = profiles;
         this.gamesPerMatch = gamesPerMatch;
         this.depth = depth;
         this.MCSims = MCSims;
         this.stats = new HashMap<>();
+        this.workers = Math.max(1, workers);
         
         for (String profile : profiles) {
             stats.put(profile, new ProfileStats());
@@ -592,9 +636,9 @@ class tournoiManager {
      * 1. Pour chaque paire de profils (i < j) :
      *    - Profil i en blanc, profil j en noir pour la première moitié
      *    - Profil j en blanc, profil i en noir pour la deuxième moitié
-     * 2. Pour chaque partie :
+     * 2. Pour chaque partie (jouées en parallèle, autant à la fois que de parties simultanées choisies) :
      *    - Jouer jusqu'à terminal (victoire, nul, ou limite 400 coups)
-     *    - Mettre à jour les statistiques
+     *    - Mettre à jour les statistiques, dans l'ordre du tournoi
      *    - Rafraîchir l'interface (barre de progression, tableau)
      * 
      * Thread-safety :
@@ -614,47 +658,94 @@ class tournoiManager {
         ui.log(gamesPerMatch + " partie(s) par match");
         ui.log("Profondeur Minimax: " + depth);
         ui.log("Simulations MC: " + MCSims);
+        ui.log("Parties simultanées: " + workers);
         ui.log("Total: " + totalMatches + " parties");
         ui.log("");
         
         // Chaque paire de profils joue UNE SEULE FOIS (avec couleurs équilibrées)
-        for (int i = 0; i < profiles.size() && running; i++) {
-            for (int j = i + 1; j < profiles.size() && running; j++) {
+        List<ScheduledGame> schedule = new ArrayList<>();
+        for (int i = 0; i < profiles.size(); i++) {
+            for (int j = i + 1; j < profiles.size(); j++) {
                 String profile1 = profiles.get(i);
                 String profile2 = profiles.get(j);
                 
-                ui.log(String.format("Match: %s vs %s", profile1, profile2));
-                
-                // Jouer la moitié des parties avec profile1 en blanc
-                for (int game = 0; game < gamesPerMatch/2 && running; game++) {
-                    GameResult result = playGame(profile1, profile2, ui);
-                    updateStats(profile1, profile2, result, true, ui, game+1);
-                    
-                    completedMatches++;
-                    ui.updateProgress((int)(completedMatches * 100.0 / totalMatches));
-                    ui.updateResults(stats);
+                // La moitié des parties avec profile1 en blanc, l'autre moitié avec couleurs inversées
+                for (int game = 0; game < gamesPerMatch/2; game++) {
+                    schedule.add(new ScheduledGame(profile1, profile2, profile1, profile2, true, game+1));
+                }
+                for (int game = 0; game < gamesPerMatch/2; game++) {
+                    schedule.add(new ScheduledGame(profile2, profile1, profile1, profile2, false, game+1+gamesPerMatch/2));
+                }
+            }
+        }
+        
+        // Les parties sont indépendantes : les lancer toutes sur le pool de threads
+        ExecutorService pool = Executors.newFixedThreadPool(workers);
+        List<Future<GameResult>> futures = new ArrayList<>();
+        for (ScheduledGame g : schedule) {
+            futures.add(pool.submit(() -> playGame(g.white, g.black, ui)));
+        }
+        
+        // Nombre de parties déjà affichées dans le tableau
+        int refreshed = 0;
+        try {
+            // Consommer les résultats dans l'ordre du tournoi (journal et statistiques identiques au mode séquentiel)
+            for (int k = 0; k < schedule.size() && running; k++) {
+                ScheduledGame g = schedule.get(k);
+                if (g.gameNum == 1) {
+                    ui.log(String.format("Match: %s vs %s", g.profile1, g.profile2));
                 }
                 
-                // Jouer l'autre moitié avec couleurs inversées
-                for (int game = 0; game < gamesPerMatch/2 && running; game++) {
-                    GameResult result = playGame(profile2, profile1, ui);
-                    updateStats(profile2, profile1, result, false, ui, game+1+gamesPerMatch/2);
-                    
-                    completedMatches++;
-                    ui.updateProgress((int)(completedMatches * 100.0 / totalMatches));
-                    ui.updateResults(stats);
+                GameResult result = futures.get(k).get();
+                if (!running) break;
+                updateStats(g.white, g.black, result, g.firstSet, ui, g.gameNum);
+                
+                completedMatches++;
+                // Les parties finies en même temps sont traitées d'affilée, avec un seul rafraîchissement
+                // du tableau et de la progression à la fin du lot
+                boolean nextReady = k + 1 < schedule.size() && futures.get(k + 1).isDone();
+                if (!nextReady) {
+                    refreshUI(ui, completedMatches, totalMatches);
+                    refreshed = completedMatches;
                 }
                 
-                ui.log("");
+                if (g.gameNum == 2 * (gamesPerMatch/2)) {
+                    ui.log("");
+                }
             }
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+        } catch (ExecutionException e) {
+            ui.log("Erreur pendant une partie : " + e.getCause());
+        } finally {
+            // Abandonner les parties restantes (arrêt ou fin du tournoi)
+            running = false;
+            pool.shutdownNow();
+        }
+        
+        // Afficher les derniers résultats d'un lot interrompu
+        if (refreshed < completedMatches) {
+            refreshUI(ui, completedMatches, totalMatches);
         }
     }
     
+    /**
+     * Rafraîchit la barre de progression et le tableau des résultats.
+     * 
+     * @param ui La fenêtre du tournoi
+     * @param completedMatches Nombre de parties terminées
+     * @param totalMatches Nombre total de parties
+     */
+    private void refreshUI(TournoiUI ui, int completedMatches, int totalMatches) {
+        ui.updateProgress((int)(completedMatches * 100.0 / totalMatches));
+        ui.updateResults(stats);
+    }
+    
     /**
      * Joue une partie complète entre deux profils.
      * 
      * Processus :
-     * 1. Créer un nouveau plateau vierge
+     * 1. Remettre le plateau du thread dans la position initiale
      * 2. Instancier les IA selon leurs profils (Minimax ou MC)
      * 3. Boucle de jeu :
      *    - Faire jouer le joueur actuel
@@ -669,71 +760,64 @@ class tournoiManager {
      * @return Le résultat de la partie
      */
     private GameResult playGame(String whiteProfile, String blackProfile, TournoiUI ui) {
-        Board board = new Board();
-        IA whiteIA = createIA('w', whiteProfile);
-        IA blackIA = createIA('b', blackProfile);
-        IA_MC whiteMC = whiteProfile.equals("Monte-Carlo") ? new IA_MC('w', MCSims) : null;
-        IA_MC blackMC = blackProfile.equals("Monte-Carlo") ? new IA_MC('b', MCSims) : null;
+        Board board = threadBoards.get();
+        board.reset();
+        // Joueurs, temps et nœuds indexés par camp : 0 = blancs, 1 = noirs
+        IA[] ias = { borrowIA('w', whiteProfile), borrowIA('b', blackProfile) };
+        IA_MC[] mcs = {
+            whiteProfile.equals("Monte-Carlo") ? new IA_MC('w', MCSims) : null,
+            blackProfile.equals("Monte-Carlo") ? new IA_MC('b', MCSims) : null
+        };
+        long[] totalTime = new long[2];
+        long[] nodesVisited = new long[2];
         
         int moveCount = 0;
-        long whiteTotalTime = 0;
-        long blackTotalTime = 0;
-        long whiteNodesVisited = 0;
-        long blackNodesVisited = 0;
-        int maxMoves = 400; // Limite pour éviter les parties infinies
-        
-        while (!board.isTerminalWithDraw() && moveCount < maxMoves && running) {
-            char currentPlayer = board.getCurrentPlayer();
-            
+        // Camp au trait (les blancs commencent)
+        int side = 0;
+        // Résultat de la position courante, calculé une fois par coup (' ' = partie en cours)
+        char outcome;
+        
+        while ((outcome = board.winner()) == ' ' && moveCount < MAX_MOVES && running) {
             long startTime = System.currentTimeMillis();
-            Move move = null;
+            Move move;
             
-            if (currentPlayer == 'w') {
-                if (whiteMC != null) {
-                    move = whiteMC.bestMove(board);
-                } else {
-                    move = whiteIA.bestMove(board);
-                    whiteNodesVisited += whiteIA.getNodesVisited();
-                }
+            if (mcs[side] != null) {
+                move = mcs[side].bestMove(board);
             } else {
-                if (blackMC != null) {
-                    move = blackMC.bestMove(board);
-                } else {
-                    move = blackIA.bestMove(board);
-                    blackNodesVisited += blackIA.getNodesVisited();
-                }
+                move = ias[side].bestMove(board);
+                nodesVisited[side] += ias[side].getNodesVisited();
             }
             
             long moveTime = System.currentTimeMillis() - startTime;
             
             if (move == null) break;
             
-            board.makeMove(move);
-            // Changer le joueur courant après chaque coup
-            board.setCurrentPlayer(currentPlayer == 'w' ? 'b' : 'w');
+            board.applyMove(move);
+            totalTime[side] += moveTime;
             moveCount++;
-            
-            if (currentPlayer == 'w') {
-                whiteTotalTime += moveTime;
-            } else {
-                blackTotalTime += moveTime;
-            }
+            // Changer le joueur courant après chaque coup
+            side ^= 1;
+            board.setCurrentPlayer(side == 0 ? 'w' : 'b');
         }
         
         GameResult result = new GameResult();
         
         // Si on a atteint la limite de coups (400), c'est un nul par limite
-        if (moveCount >= maxMoves) {
+        if (moveCount >= MAX_MOVES) {
             result.winner = 'l'; // 'l' pour limit (limite)
         } else {
-            result.winner = board.winner();
+            result.winner = outcome;
         }
         
         result.moves = moveCount;
-        result.whiteTotalTime = whiteTotalTime;
-        result.blackTotalTime = blackTotalTime;
-        result.whiteNodesVisited = whiteNodesVisited;
-        result.blackNodesVisited = blackNodesVisited;
+        result.whiteTotalTime = totalTime[0];
+        result.blackTotalTime = totalTime[1];
+        result.whiteNodesVisited = nodesVisited[0];
+        result.blackNodesVisited = nodesVisited[1];
+        
+        // Rendre les IA pour les parties suivantes
+        releaseIA(whiteProfile, ias[0]);
+        releaseIA(blackProfile, ias[1]);
         
         return result;
     }
@@ -779,40 +863,90 @@ class tournoiManager {
             whiteStats.losses++;
             whiteStats.lossesAsWhite++;
             ui.log("  Partie " + gameNum + ": Victoire " + blackProfile + " (Noirs) en " + result.moves + " coups");
-        } else if (result.winner == 'd') {
-            whiteStats.draws++;
-            whiteStats.drawsAsWhite++;
-            blackStats.draws++;
-            blackStats.drawsAsBlack++;
-            ui.log("  Partie " + gameNum + ": Match nul (égalité règles internationales) après " + result.moves + " coups");
-        } else if (result.winner == 'l') {
-            whiteStats.draws++;
-            whiteStats.drawsAsWhite++;
-            blackStats.draws++;
-            blackStats.drawsAsBlack++;
-            ui.log("  Partie " + gameNum + ": Match nul (limite de " + 400 + " coups atteinte) après " + result.moves + " coups");
         } else {
+            // Tous les nuls se comptent de la même façon, seul le motif affiché change
             whiteStats.draws++;
             whiteStats.drawsAsWhite++;
             blackStats.draws++;
             blackStats.drawsAsBlack++;
-            ui.log("  Partie " + gameNum + ": Match nul (raison inconnue) après " + result.moves + " coups");
+            String reason = DRAW_REASONS.getOrDefault(result.winner, "raison inconnue");
+            ui.log("  Partie " + gameNum + ": Match nul (" + reason + ") après " + result.moves + " coups");
         }
     }
     
     /**
-     * Crée une IA du profil spécifié.
+     * Fournit une IA du profil spécifié pour la durée d'une partie, à rendre avec releaseIA.
+     * Une IA inactive du profil est réutilisée si possible, sinon une nouvelle est créée.
      * 
      * @param color Couleur de l'IA ('w' pour blanc, 'b' pour noir)
     * @param profile Nom du profil ("Perdant", "Expert", etc.)
-     * @return Une nouvelle instance d'IA Minimax avec les paramètres configurés
+     * @return Une instance d'IA Minimax utilisée par cette seule partie
      *         (ou null si le profil est "Monte-Carlo", cas traité à part)
      */
-    private IA createIA(char color, String profile) {
+    private IA borrowIA(char color, String profile) {
         if (profile.equals("Monte-Carlo")) {
             return null; // Utiliser IA_MC à la place
         }
-        return new IA(color, depth, profile);
+        IA ia;
+        synchronized (idleIAs) {
+            Deque<IA> idle = idleIAs.get(profile);
+            ia = (idle == null) ? null : idle.poll();
+        }
+        if (ia == null) {
+            return new IA(color, depth, profile);
+        }
+        // L'IA prend la couleur du camp au trait à chaque recherche ;
+        // "Poids Random" tire de nouveaux poids à chaque partie
+        if (profile.equals("Poids Random")) {
+            ia.setProfile(profile);
+        }
+        return ia;
+    }
+    
+    /**
+     * Rend une IA à la fin de sa partie : elle est gardée pour une prochaine partie du même profil,
+     * sauf si IDLE_IAS_PER_PROFILE IA de ce profil attendent déjà (elle est alors libérée).
+     * 
+     * @param profile Nom du profil de l'IA
+     * @param ia L'IA à rendre (null pour "Monte-Carlo", ignorée)
+     */
+    private void releaseIA(String profile, IA ia) {
+        if (ia == null) {
+            return;
+        }
+        synchronized (idleIAs) {
+            Deque<IA> idle = idleIAs.computeIfAbsent(profile, k -> new ArrayDeque<>());
+            if (idle.size() < IDLE_IAS_PER_PROFILE) {
+                idle.push(ia);
+            }
+        }
+    }
+    
+    /**
+     * Partie planifiée du tournoi : couleurs des profils et position dans le match.
+     */
+    private static class ScheduledGame {
+        /** Profil jouant les blancs */
+        final String white;
+        /** Profil jouant les noirs */
+        final String black;
+        /** Premier profil du match (pour l'en-tête du journal) */
+        final String profile1;
+        /** Second profil du match */
+        final String profile2;
+        /** true pour la première moitié du match (couleurs non inversées) */
+        final boolean firstSet;
+        /** Numéro de la partie dans le match (à partir de 1) */
+        final int gameNum;
+        
+        ScheduledGame(String white, String black, String profile1, String profile2, boolean firstSet, int gameNum) {
+            this.white = white;
+            this.black = black;
+            this.profile1 = profile1;
+            this.profile2 = profile2;
+            this.firstSet = firstSet;
+            this.gameNum = gameNum;
+        }
     }
 }
 